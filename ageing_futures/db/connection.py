@@ -1,25 +1,153 @@
 """Database connection utilities with Streamlit-friendly caching."""
 from __future__ import annotations
 
+import json
 import os
 from functools import lru_cache
 from typing import Optional
 
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event, inspect, text
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlmodel import Session as DBSession, SQLModel, create_engine
 
 try:
     import streamlit as st
 except ModuleNotFoundError:  # pragma: no cover - used in non-Streamlit contexts
     st = None  # type: ignore
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - falls back to stdlib json
+    orjson = None  # type: ignore
+
 
 DEFAULT_SQLITE_URL = "sqlite:///ageing_futures.db"
 
+# LIFO checkout keeps the most recently used (warm) connection in rotation.
+POOL_OPTIONS = {
+    "poolclass": QueuePool,
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_use_lifo": True,
+    "pool_pre_ping": True,
+}
+# Server databases (and proxies in front of them) drop idle connections; recycle
+# pooled ones before that happens rather than relying on pre-ping alone.
+SERVER_POOL_OPTIONS = {**POOL_OPTIONS, "pool_recycle": 1800}
+
+
+def _to_builtin(value):
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(value) -> str:
+    encoded = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    if b":null" in encoded or b",null" in encoded or b"[null" in encoded:
+        # orjson writes NaN and Infinity as null; stdlib json keeps them as tokens,
+        # so a NaN metric reads back as NaN rather than None.
+        return json.dumps(value, default=_to_builtin)
+    return encoded.decode("utf-8")
+
+
+def _orjson_loads(value):
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        # Rows holding NaN/Infinity tokens, which orjson refuses to parse.
+        return json.loads(value)
+
+
+# Serializers used by every JSON column; SQLAlchemy defaults to stdlib json otherwise.
+JSON_OPTIONS = (
+    {"json_serializer": _orjson_dumps, "json_deserializer": _orjson_loads} if orjson is not None else {}
+)
+
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _is_memory_url(url: str) -> bool:
+    return url == "sqlite://" or ":memory:" in url
+
+
+def _install_sqlite_pragmas(engine, use_wal: bool) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if use_wal:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 
 def _create_engine(db_url: Optional[str] = None):
     url = db_url or os.getenv("DATABASE_URL", DEFAULT_SQLITE_URL)
-    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
-    return create_engine(url, echo=False, connect_args=connect_args)
+    if not url.startswith("sqlite"):
+        return create_engine(url, echo=False, **JSON_OPTIONS, **SERVER_POOL_OPTIONS)
+
+    connect_args = {"check_same_thread": False}
+    in_memory = _is_memory_url(url)
+    if in_memory:
+        # A single shared connection keeps the in-memory database alive across checkouts.
+        engine = create_engine(
+            url, echo=False, connect_args=connect_args, poolclass=StaticPool, **JSON_OPTIONS
+        )
+    else:
+        engine = create_engine(
+            url, echo=False, connect_args=connect_args, **JSON_OPTIONS, **POOL_OPTIONS
+        )
+    # WAL needs a file on disk; in-memory databases only get the remaining PRAGMAs.
+    _install_sqlite_pragmas(engine, use_wal=not in_memory)
+    return engine
+
+
+DECISION_UNIQUE_COLUMNS = ["session_id", "team_id", "round_id"]
+
+
+def _ensure_decision_unique_key(engine) -> None:
+    """Add the decision upsert key to tables created before it existed.
+
+    ``create_all`` never alters an existing table, and ``upsert_decision``'s
+    ``ON CONFLICT`` needs a unique key on exactly these columns. The old
+    check-then-insert upsert could leave duplicate rows for one key; only the
+    newest (highest ``id``) of each is kept so the index can be created.
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table("decision"):
+        return
+    covered = [c["column_names"] for c in inspector.get_unique_constraints("decision")]
+    covered += [i["column_names"] for i in inspector.get_indexes("decision") if i["unique"]]
+    if DECISION_UNIQUE_COLUMNS in covered:
+        return
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "DELETE FROM decision WHERE id NOT IN ("
+                "SELECT id FROM (SELECT MAX(id) AS id FROM decision "
+                "GROUP BY session_id, team_id, round_id) AS newest)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_decision_session_team_round "
+                "ON decision (session_id, team_id, round_id)"
+            )
+        )
+
+
+def _prepare_schema(engine) -> None:
+    SQLModel.metadata.create_all(engine)
+    _ensure_decision_unique_key(engine)
 
 
 if st is not None:
@@ -28,7 +156,7 @@ if st is not None:
     def get_engine(db_url: Optional[str] = None):
         """Return a cached SQLModel engine for Streamlit sessions."""
         engine = _create_engine(db_url)
-        SQLModel.metadata.create_all(engine)
+        _prepare_schema(engine)
         return engine
 
 else:
@@ -36,8 +164,17 @@ else:
     @lru_cache(maxsize=1)
     def get_engine(db_url: Optional[str] = None):
         engine = _create_engine(db_url)
-        SQLModel.metadata.create_all(engine)
+        _prepare_schema(engine)
         return engine
 
 
-__all__ = ["get_engine", "DEFAULT_SQLITE_URL"]
+def get_db_session(engine=None) -> DBSession:
+    """Open a DB session whose loaded objects stay usable after commit.
+
+    ``expire_on_commit=False`` avoids the reload SELECT that SQLAlchemy would
+    otherwise issue on the next attribute access after each ``commit()``.
+    """
+    return DBSession(engine if engine is not None else get_engine(), expire_on_commit=False)
+
+
+__all__ = ["get_engine", "get_db_session", "DEFAULT_SQLITE_URL"]
@@ -4,44 +4,114 @@ from __future__ import annotations
 import datetime as dt
 import secrets
 import string
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from sqlalchemy import Row, and_, func, lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased, selectinload
 from sqlmodel import Session as DBSession, select
 
 from .models import Audit, Decision, Result, Round, Session, Team
 
 ROOM_CODE_ALPHABET = string.ascii_uppercase + string.digits
 ROOM_CODE_LENGTH = 6
+_ROOM_CODE_BYTE_LIMIT = 256 - 256 % len(ROOM_CODE_ALPHABET)
+
+# Dialect-specific INSERT constructs supporting ``ON CONFLICT DO UPDATE``.
+_UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+# Batch size for streaming row iterators.
+YIELD_PER = 200
+
+# Result metrics the leaderboard scores on.
+LEADERBOARD_METRICS = ("health_value", "cost_value", "capacity_value", "equity_value")
 
 
 def generate_room_code() -> str:
-    return "".join(secrets.choice(ROOM_CODE_ALPHABET) for _ in range(ROOM_CODE_LENGTH))
+    # Draw all bytes in one CSPRNG call; bytes at or above the largest multiple of the
+    # alphabet size are rejected so the modulo mapping stays unbiased.
+    code = ""
+    while len(code) < ROOM_CODE_LENGTH:
+        code += "".join(
+            ROOM_CODE_ALPHABET[byte % len(ROOM_CODE_ALPHABET)]
+            for byte in secrets.token_bytes(ROOM_CODE_LENGTH * 2)
+            if byte < _ROOM_CODE_BYTE_LIMIT
+        )
+    return code[:ROOM_CODE_LENGTH]
 
 
 def create_session(db: DBSession, settings: Dict[str, Any], random_seed: int) -> Session:
     code = generate_room_code()
     session = Session(code=code, settings_json=settings, random_seed=random_seed)
     db.add(session)
-    db.commit()
-    db.refresh(session)
+    db.flush()
     db.add(Audit(session_id=session.id, action="session_created", payload_json=settings))
     db.commit()
     return session
 
 
 def get_session_by_code(db: DBSession, code: str) -> Optional[Session]:
-    return db.exec(select(Session).where(Session.code == code)).first()
+    stmt = lambda_stmt(lambda: select(Session).where(Session.code == code))
+    return db.scalars(stmt).first()
+
+
+def get_session_overview(db: DBSession, session_id: int) -> Optional[Session]:
+    """Session with its teams, rounds and each round's decisions loaded up front.
+
+    ``selectinload`` fetches each collection with one ``IN`` query, so the whole
+    tree costs a fixed number of statements regardless of team or round count.
+    """
+    stmt = (
+        select(Session)
+        .where(Session.id == session_id)
+        .options(
+            selectinload(Session.teams),
+            selectinload(Session.rounds).selectinload(Round.decisions),
+        )
+    )
+    return db.exec(stmt).first()
+
+
+def fetch_team_round_context(
+    db: DBSession, session_id: int, team_id: int
+) -> Optional[Tuple[Session, Optional[Round], Optional[Decision]]]:
+    """Session, its latest round and the team's decision for that round, in one query."""
+    latest_index = (
+        select(func.max(Round.index))
+        .where(Round.session_id == Session.id)
+        .correlate(Session)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Session, Round, Decision)
+        .outerjoin(Round, and_(Round.session_id == Session.id, Round.index == latest_index))
+        .outerjoin(Decision, and_(Decision.round_id == Round.id, Decision.team_id == team_id))
+        .where(Session.id == session_id)
+        .limit(1)
+    )
+    row = db.execute(stmt).first()
+    return tuple(row) if row is not None else None
 
 
 def list_sessions(db: DBSession) -> List[Session]:
-    return list(db.exec(select(Session).order_by(Session.created_at.desc())))
+    stmt = lambda_stmt(lambda: select(Session).order_by(Session.created_at.desc()))
+    return list(db.scalars(stmt))
+
+
+def iter_sessions(
+    db: DBSession,
+    cols: Sequence[Any] = (Session.code, Session.created_at, Session.status, Session.current_round),
+) -> Iterator[Row]:
+    """Stream selected session columns as lightweight rows, newest first."""
+    stmt = select(*cols).order_by(Session.created_at.desc()).execution_options(yield_per=YIELD_PER)
+    yield from db.execute(stmt)
 
 
 def create_team(db: DBSession, session: Session, name: str, colour: str, icon: str) -> Team:
     team = Team(session_id=session.id, name=name, colour=colour, icon=icon)
     db.add(team)
-    db.commit()
-    db.refresh(team)
+    db.flush()
     db.add(
         Audit(
             session_id=session.id,
@@ -55,7 +125,25 @@ def create_team(db: DBSession, session: Session, name: str, colour: str, icon: s
 
 
 def list_teams(db: DBSession, session_id: int) -> List[Team]:
-    return list(db.exec(select(Team).where(Team.session_id == session_id).order_by(Team.joined_at)))
+    stmt = lambda_stmt(
+        lambda: select(Team).where(Team.session_id == session_id).order_by(Team.joined_at)
+    )
+    return list(db.scalars(stmt))
+
+
+def iter_teams(
+    db: DBSession,
+    session_id: int,
+    cols: Sequence[Any] = (Team.id, Team.name, Team.colour),
+) -> Iterator[Row]:
+    """Stream selected team columns as lightweight rows in join order."""
+    stmt = (
+        select(*cols)
+        .where(Team.session_id == session_id)
+        .order_by(Team.joined_at)
+        .execution_options(yield_per=YIELD_PER)
+    )
+    yield from db.execute(stmt)
 
 
 def start_round(
@@ -73,8 +161,7 @@ def start_round(
         start_ts=dt.datetime.utcnow(),
     )
     db.add(round_obj)
-    db.commit()
-    db.refresh(round_obj)
+    db.flush()
     session.current_round = index
     session.status = "active"
     db.add(session)
@@ -89,7 +176,8 @@ def start_round(
     return round_obj
 
 
-def lock_round(db: DBSession, round_obj: Round) -> None:
+def lock_round(db: DBSession, round_obj: Round, commit: bool = True) -> None:
+    """Mark a round locked; pass ``commit=False`` to fold it into the caller's transaction."""
     round_obj.lock_ts = dt.datetime.utcnow()
     db.add(round_obj)
     db.add(
@@ -99,7 +187,27 @@ def lock_round(db: DBSession, round_obj: Round) -> None:
             payload_json={"round": round_obj.index},
         )
     )
-    db.commit()
+    if commit:
+        db.commit()
+
+
+def _update_decision_in_place(db: DBSession, values: Dict[str, Any], locked: bool) -> None:
+    """Select-then-update fallback for dialects without ``ON CONFLICT`` support."""
+    decision = db.exec(
+        select(Decision).where(
+            Decision.session_id == values["session_id"],
+            Decision.team_id == values["team_id"],
+            Decision.round_id == values["round_id"],
+        )
+    ).first()
+    if decision is None:
+        db.add(Decision(**values))
+        return
+    decision.policies_json = values["policies_json"]
+    decision.budget_spent = values["budget_spent"]
+    if locked:
+        decision.locked_ts = values["locked_ts"]
+    db.add(decision)
 
 
 def upsert_decision(
@@ -111,29 +219,32 @@ def upsert_decision(
     budget_spent: float,
     locked: bool = False,
 ) -> Decision:
-    decision = db.exec(
-        select(Decision).where(
-            Decision.session_id == session_id,
-            Decision.team_id == team_id,
-            Decision.round_id == round_id,
-        )
-    ).first()
     now = dt.datetime.utcnow()
-    if decision is None:
-        decision = Decision(
-            session_id=session_id,
-            team_id=team_id,
-            round_id=round_id,
-            policies_json=policies,
-            budget_spent=budget_spent,
-            locked_ts=now if locked else None,
-        )
+    values = {
+        "session_id": session_id,
+        "team_id": team_id,
+        "round_id": round_id,
+        "policies_json": policies,
+        "budget_spent": budget_spent,
+        "locked_ts": now if locked else None,
+    }
+    insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        _update_decision_in_place(db, values, locked)
     else:
-        decision.policies_json = policies
-        decision.budget_spent = budget_spent
+        stmt = insert(Decision).values(**values)
+        updates = {
+            "policies_json": stmt.excluded.policies_json,
+            "budget_spent": stmt.excluded.budget_spent,
+        }
         if locked:
-            decision.locked_ts = now
-    db.add(decision)
+            updates["locked_ts"] = stmt.excluded.locked_ts
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["session_id", "team_id", "round_id"],
+                set_=updates,
+            )
+        )
     db.add(
         Audit(
             session_id=session_id,
@@ -143,74 +254,187 @@ def upsert_decision(
         )
     )
     db.commit()
-    db.refresh(decision)
-    return decision
+    return db.exec(
+        select(Decision)
+        .where(
+            Decision.session_id == session_id,
+            Decision.team_id == team_id,
+            Decision.round_id == round_id,
+        )
+        .execution_options(populate_existing=True)
+    ).one()
 
 
-def record_result(
-    db: DBSession,
+def build_result(
     session_id: int,
     team_id: int,
     round_id: int,
     metrics: Dict[str, Any],
     timeseries: Dict[str, Any],
 ) -> Result:
-    result = Result(
+    """Unsaved :class:`Result` for batching with :func:`record_results`."""
+    return Result(
         session_id=session_id,
         team_id=team_id,
         round_id=round_id,
         metrics_json=metrics,
         timeseries_json=timeseries,
     )
+
+
+def record_result(
+    db: DBSession,
+    session_id: int,
+    team_id: int,
+    round_id: int,
+    metrics: Dict[str, Any],
+    timeseries: Dict[str, Any],
+    audit: bool = True,
+) -> Result:
+    """Persist a round result; pass ``audit=False`` when the caller batches audits via :func:`log_audits`."""
+    result = build_result(session_id, team_id, round_id, metrics, timeseries)
     db.add(result)
-    db.add(
-        Audit(
-            session_id=session_id,
-            team_id=team_id,
-            action="result_recorded",
-            payload_json={"round": round_id},
+    if audit:
+        db.add(
+            Audit(
+                session_id=session_id,
+                team_id=team_id,
+                action="result_recorded",
+                payload_json={"round": round_id},
+            )
         )
-    )
     db.commit()
-    db.refresh(result)
     return result
 
 
+def record_results(db: DBSession, results: Iterable[Result], commit: bool = True) -> None:
+    """Insert many results built by :func:`build_result` in one batch.
+
+    Commits once, or not at all with ``commit=False`` so the caller can write
+    related rows in the same transaction.
+    """
+    results = list(results)
+    if not results:
+        return
+    db.bulk_save_objects(results)
+    if commit:
+        db.commit()
+
+
 def list_results_for_round(db: DBSession, session_id: int, round_id: int) -> List[Result]:
-    return list(
-        db.exec(
-            select(Result).where(
-                Result.session_id == session_id, Result.round_id == round_id
-            )
+    stmt = lambda_stmt(
+        lambda: select(Result).where(
+            Result.session_id == session_id, Result.round_id == round_id
         )
     )
+    return list(db.scalars(stmt))
 
 
 def list_results_for_team(db: DBSession, session_id: int, team_id: int) -> List[Result]:
-    return list(
-        db.exec(
-            select(Result)
-            .where(Result.session_id == session_id, Result.team_id == team_id)
-            .order_by(Result.round_id)
-        )
+    stmt = lambda_stmt(
+        lambda: select(Result)
+        .where(Result.session_id == session_id, Result.team_id == team_id)
+        .order_by(Result.round_id)
+    )
+    return list(db.scalars(stmt))
+
+
+def iter_results_for_team(
+    db: DBSession,
+    session_id: int,
+    team_id: int,
+    cols: Sequence[Any] = (Result.id, Result.round_id),
+) -> Iterator[Row]:
+    """Stream selected result columns for one team, oldest round first."""
+    stmt = (
+        select(*cols)
+        .where(Result.session_id == session_id, Result.team_id == team_id)
+        .order_by(Result.round_id)
+        .execution_options(yield_per=YIELD_PER)
+    )
+    yield from db.execute(stmt)
+
+
+def get_result_payload(db: DBSession, result_id: int) -> Optional[Row]:
+    """A result's metrics and monthly trace, without the persisted cohort state.
+
+    The ``monthly`` list is extracted from the timeseries JSON in SQL, so the
+    much larger cohort archive stored alongside it is never transferred or parsed.
+    """
+    stmt = select(
+        Result.metrics_json.label("metrics"),
+        Result.timeseries_json["monthly"].label("monthly"),
+    ).where(Result.id == result_id)
+    return db.execute(stmt).first()
+
+
+def iter_results_for_session(db: DBSession, session_id: int) -> Iterator[Result]:
+    """Stream a session's results ordered by team then round, ``YIELD_PER`` rows at a time."""
+    stmt = (
+        select(Result)
+        .where(Result.session_id == session_id)
+        .order_by(Result.team_id, Result.round_id)
+        .execution_options(yield_per=YIELD_PER)
+    )
+    yield from db.scalars(stmt)
+
+
+def latest_result_id(db: DBSession, session_id: int) -> Optional[int]:
+    """Highest result id in a session; changes whenever a new result is recorded."""
+    stmt = lambda_stmt(lambda: select(func.max(Result.id)).where(Result.session_id == session_id))
+    return db.scalar(stmt)
+
+
+def _latest_result_id(session_id: int):
+    """Correlated subquery for a team's most recent result id in a session."""
+    prior = aliased(Result)
+    return (
+        select(prior.id)
+        .where(prior.session_id == session_id, prior.team_id == Team.id)
+        .order_by(prior.round_id.desc(), prior.id.desc())
+        .limit(1)
+        .correlate(Team)
+        .scalar_subquery()
+    )
+
+
+def _leaderboard_select(session_id: int):
+    latest_id = _latest_result_id(session_id)
+    return (
+        select(Team, Result)
+        .outerjoin(Result, and_(Result.team_id == Team.id, Result.id == latest_id))
+        .where(Team.session_id == session_id)
+        .order_by(Team.joined_at)
     )
 
 
 def fetch_leaderboard_data(
     db: DBSession, session_id: int
 ) -> List[Tuple[Team, Optional[Result]]]:
-    teams = list_teams(db, session_id)
-    results = list(
-        db.exec(
-            select(Result)
-            .where(Result.session_id == session_id)
-            .order_by(Result.round_id.desc())
-        )
+    stmt = lambda_stmt(lambda: _leaderboard_select(session_id))
+    return [(team, result) for team, result in db.execute(stmt)]
+
+
+def fetch_leaderboard_metrics(
+    db: DBSession, session_id: int, metrics: Sequence[str] = LEADERBOARD_METRICS
+) -> List[Row]:
+    """Team name plus each metric from its latest result, extracted in SQL.
+
+    The JSON lookups compile to the dialect's own extract function, so neither
+    full ``Result`` rows nor their JSON payloads are loaded. Teams without a
+    result (or a missing metric) read as ``0.0``.
+    """
+    latest_id = _latest_result_id(session_id)
+    values = [
+        func.coalesce(Result.metrics_json[name].as_float(), 0.0).label(name) for name in metrics
+    ]
+    stmt = (
+        select(Team.name.label("team"), *values)
+        .outerjoin(Result, and_(Result.team_id == Team.id, Result.id == latest_id))
+        .where(Team.session_id == session_id)
+        .order_by(Team.joined_at)
     )
-    latest_by_team: Dict[int, Result] = {}
-    for result in results:
-        latest_by_team.setdefault(result.team_id, result)
-    return [(team, latest_by_team.get(team.id)) for team in teams]
+    return list(db.execute(stmt))
 
 
 def log_audit(db: DBSession, session_id: int, action: str, payload: Dict[str, Any]) -> None:
@@ -218,18 +442,40 @@ def log_audit(db: DBSession, session_id: int, action: str, payload: Dict[str, An
     db.commit()
 
 
+def log_audits(db: DBSession, rows: Iterable[Dict[str, Any]], commit: bool = True) -> None:
+    """Insert many audit rows in a single batched INSERT; ``commit=False`` defers the commit."""
+    audits = [Audit(**row) for row in rows]
+    if not audits:
+        return
+    db.bulk_save_objects(audits)
+    if commit:
+        db.commit()
+
+
 __all__ = [
     "create_session",
     "get_session_by_code",
+    "get_session_overview",
+    "fetch_team_round_context",
     "list_sessions",
+    "iter_sessions",
     "create_team",
     "list_teams",
+    "iter_teams",
     "start_round",
     "lock_round",
     "upsert_decision",
+    "build_result",
     "record_result",
+    "record_results",
     "list_results_for_round",
     "list_results_for_team",
+    "iter_results_for_team",
+    "iter_results_for_session",
+    "get_result_payload",
+    "latest_result_id",
     "fetch_leaderboard_data",
+    "fetch_leaderboard_metrics",
     "log_audit",
+    "log_audits",
 ]
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import Column, DateTime, JSON
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Column, DateTime, Index, JSON, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlmodel import Field, Relationship, SQLModel
 
 
 class Session(SQLModel, table=True):
@@ -21,6 +22,16 @@ class Session(SQLModel, table=True):
     current_round: int = Field(default=0)
     random_seed: int = Field(default=1234)
 
+    # Read-only collections for eager loading (``selectinload``); writes go through
+    # the foreign keys. Spelled out as ``sa_relationship`` because the postponed
+    # annotations here are strings SQLModel cannot resolve into a target class.
+    teams: List["Team"] = Relationship(
+        sa_relationship=relationship("Team", order_by="Team.joined_at", viewonly=True)
+    )
+    rounds: List["Round"] = Relationship(
+        sa_relationship=relationship("Round", order_by="Round.index", viewonly=True)
+    )
+
 
 class Team(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -46,8 +57,16 @@ class Round(SQLModel, table=True):
         default_factory=dict, sa_column=Column(JSON, nullable=False)
     )
 
+    decisions: List["Decision"] = Relationship(
+        sa_relationship=relationship("Decision", viewonly=True)
+    )
+
 
 class Decision(SQLModel, table=True):
+    __table_args__ = (
+        UniqueConstraint("session_id", "team_id", "round_id", name="uq_decision_session_team_round"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: int = Field(index=True, foreign_key="session.id")
     team_id: int = Field(index=True, foreign_key="team.id")
@@ -62,6 +81,11 @@ class Decision(SQLModel, table=True):
 
 
 class Result(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_result_session_round", "session_id", "round_id"),
+        Index("ix_result_session_team_round", "session_id", "team_id", "round_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: int = Field(index=True, foreign_key="session.id")
     team_id: int = Field(index=True, foreign_key="team.id")
@@ -75,6 +99,8 @@ class Result(SQLModel, table=True):
 
 
 class Audit(SQLModel, table=True):
+    __table_args__ = (Index("ix_audit_session_ts", "session_id", "ts"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: int = Field(index=True, foreign_key="session.id")
     team_id: Optional[int] = Field(default=None, foreign_key="team.id")
@@ -0,0 +1,13 @@
+"""Optional Numba acceleration shared by the simulation kernels."""
+from __future__ import annotations
+
+try:
+    from numba import njit, prange
+except ModuleNotFoundError:  # pragma: no cover - numba is an optional accelerator
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
+HAVE_NUMBA = njit is not None
+
+
+__all__ = ["HAVE_NUMBA", "njit", "prange"]
@@ -1,12 +1,14 @@
 """Synthetic baseline cohort generation."""
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
-from .states import Cohort, LTCState
+from ._jit import HAVE_NUMBA, njit, prange
+from .states import Cohort, LTCState, pack_columns
 from .utils import BaselinePopulationConfig, load_config_bundle, rng
 
 AGE_BANDS = {
@@ -16,15 +18,78 @@ AGE_BANDS = {
     "80-84": (80, 84),
     "85+": (85, 95),
 }
+_AGE_BAND_NAMES = list(AGE_BANDS)
+_AGE_BAND_LOWS = np.array([bounds[0] for bounds in AGE_BANDS.values()])
+_AGE_BAND_HIGHS = np.array([bounds[1] for bounds in AGE_BANDS.values()])
 
 
-def _sample_from_distribution(gen: np.random.Generator, dist: Dict[str, float], size: int) -> np.ndarray:
-    choices = list(dist.keys())
-    probs = np.array([dist[k] for k in choices], dtype=float)
+@lru_cache(maxsize=32)
+def _prepare_distribution(items: Tuple[Tuple[str, float], ...]) -> Tuple[np.ndarray, np.ndarray]:
+    choices = np.array([key for key, _ in items])
+    probs = np.array([weight for _, weight in items], dtype=float)
     probs = probs / probs.sum()
+    # Cached arrays are shared between callers, so guard them against mutation.
+    choices.setflags(write=False)
+    probs.setflags(write=False)
+    return choices, probs
+
+
+def _sample_from_distribution(gen: np.random.Generator, dist: Dict[str, float], size: int) -> np.ndarray:
+    choices, probs = _prepare_distribution(tuple(dist.items()))
     return gen.choice(choices, size=size, p=probs)
 
 
+def _sample_codes_from_distribution(
+    gen: np.random.Generator, dist: Dict[str, float], size: int
+) -> Tuple[np.ndarray, List[str]]:
+    """Sample category codes rather than labels; returns ``(codes, categories)``."""
+    choices, probs = _prepare_distribution(tuple(dist.items()))
+    codes = gen.choice(len(choices), size=size, p=probs)
+    return codes.astype(np.min_scalar_type(len(choices) - 1)), choices.tolist()
+
+
+def _assign_ltc_state_numpy(ages: np.ndarray, imd: np.ndarray, u: np.ndarray) -> np.ndarray:
+    # LTC baseline distribution: older + deprived more likely
+    base_prob = 0.2 + 0.01 * (ages - 65) + 0.03 * (imd - 3)
+    base_prob = np.clip(base_prob, 0.05, 0.9)
+    progression_prob = np.clip(0.15 + 0.008 * (ages - 70), 0.05, 0.8)
+    severe_prob = np.clip(0.06 + 0.01 * (ages - 80), 0.02, 0.6)
+    # Each tier is reached only from the one below, so P(state >= k) is the running
+    # product of the stage probabilities and one uniform draw places every agent.
+    p_mild = base_prob
+    p_moderate = p_mild * progression_prob
+    p_severe = p_moderate * severe_prob
+    return (u < p_mild).astype(np.int8) + (u < p_moderate) + (u < p_severe)
+
+
+if HAVE_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _ltc_kernel(ages, imd, u, out):
+        for i in prange(ages.shape[0]):
+            age = ages[i]
+            p_mild = min(0.9, max(0.05, 0.2 + 0.01 * (age - 65.0) + 0.03 * (imd[i] - 3.0)))
+            p_moderate = p_mild * min(0.8, max(0.05, 0.15 + 0.008 * (age - 70.0)))
+            p_severe = p_moderate * min(0.6, max(0.02, 0.06 + 0.01 * (age - 80.0)))
+            out[i] = (u[i] < p_mild) + (u[i] < p_moderate) + (u[i] < p_severe)
+
+    def _assign_ltc_state(ages: np.ndarray, imd: np.ndarray, u: np.ndarray) -> np.ndarray:
+        out = np.empty(ages.shape[0], dtype=np.int8)
+        _ltc_kernel(ages, imd, u, out)
+        return out
+
+else:
+    _assign_ltc_state = _assign_ltc_state_numpy
+
+
+def baseline_cohort_params(cfg: BaselinePopulationConfig) -> Dict[str, float]:
+    """Cohort-wide scalars (bed capacity per 1k) taken from the baseline config."""
+    return {
+        "hospital_beds_per_1k": float(cfg.care_capacity.get("hospital_beds_per_1k", 3.0)),
+        "care_home_beds_per_1k": float(cfg.care_capacity.get("care_home_beds_per_1k", 5.0)),
+    }
+
+
 def create_baseline_cohort(
     seed: int,
     baseline_config: BaselinePopulationConfig | None = None,
@@ -34,59 +99,52 @@ def create_baseline_cohort(
     n = cfg.cohort_size
 
     age_band = _sample_from_distribution(gen, cfg.age_distribution, n)
-    ages = np.empty(n)
-    for band, bounds in AGE_BANDS.items():
-        mask = age_band == band
-        if band == "85+":
-            ages[mask] = gen.integers(bounds[0], bounds[1] + 1, size=mask.sum())
-        else:
-            ages[mask] = gen.integers(bounds[0], bounds[1] + 1, size=mask.sum())
-
-    sex = _sample_from_distribution(gen, cfg.sex_distribution, n)
-    region = _sample_from_distribution(gen, cfg.regions, n)
+    band_idx = pd.Categorical(age_band, categories=_AGE_BAND_NAMES).codes
+    ages = gen.integers(_AGE_BAND_LOWS[band_idx], _AGE_BAND_HIGHS[band_idx] + 1).astype(np.float32)
+
+    sex, sex_categories = _sample_codes_from_distribution(gen, cfg.sex_distribution, n)
+    region, region_categories = _sample_codes_from_distribution(gen, cfg.regions, n)
     imd = gen.choice(np.arange(1, len(cfg.imd_distribution) + 1), size=n, p=np.array(cfg.imd_distribution))
-    urban_rural = _sample_from_distribution(gen, cfg.urban_rural_split, n)
+    urban_rural, urban_rural_categories = _sample_codes_from_distribution(gen, cfg.urban_rural_split, n)
 
-    service_gp = gen.normal(cfg.service_indices.get("gp_density_mean", 0.0), cfg.service_indices.get("gp_density_sd", 0.1), size=n)
-    service_comm = gen.normal(cfg.service_indices.get("community_capacity_mean", 0.0), cfg.service_indices.get("community_capacity_sd", 0.1), size=n)
-    heat = gen.normal(cfg.environment_indices.get("heat_exposure_mean", 0.0), cfg.environment_indices.get("heat_exposure_sd", 0.1), size=n)
-    cold = gen.normal(cfg.environment_indices.get("cold_exposure_mean", 0.0), cfg.environment_indices.get("cold_exposure_sd", 0.1), size=n)
+    service_gp = gen.normal(cfg.service_indices.get("gp_density_mean", 0.0), cfg.service_indices.get("gp_density_sd", 0.1), size=n).astype(np.float32)
+    service_comm = gen.normal(cfg.service_indices.get("community_capacity_mean", 0.0), cfg.service_indices.get("community_capacity_sd", 0.1), size=n).astype(np.float32)
+    heat = gen.normal(cfg.environment_indices.get("heat_exposure_mean", 0.0), cfg.environment_indices.get("heat_exposure_sd", 0.1), size=n).astype(np.float32)
+    cold = gen.normal(cfg.environment_indices.get("cold_exposure_mean", 0.0), cfg.environment_indices.get("cold_exposure_sd", 0.1), size=n).astype(np.float32)
 
-    # LTC baseline distribution: older + deprived more likely
-    base_prob = 0.2 + 0.01 * (ages - 65) + 0.03 * (imd - 3)
-    base_prob = np.clip(base_prob, 0.05, 0.9)
-    ltc_state = np.where(gen.random(n) < base_prob, 1, 0)
-    progression_prob = np.clip(0.15 + 0.008 * (ages - 70), 0.05, 0.8)
-    ltc_state = np.where(gen.random(n) < progression_prob * (ltc_state > 0), 2, ltc_state)
-    severe_prob = np.clip(0.06 + 0.01 * (ages - 80), 0.02, 0.6)
-    ltc_state = np.where(gen.random(n) < severe_prob * (ltc_state >= 2), 3, ltc_state)
+    u_ltc, u_disability = gen.random((2, n))
+    ltc_state = _assign_ltc_state(ages, imd, u_ltc)
 
-    disability = gen.random(n) < np.clip(0.1 + 0.02 * (ltc_state), 0, 0.7)
-    hospitalised = np.zeros(n, dtype=bool)
-    alive = np.ones(n, dtype=bool)
-    care_home = np.zeros(n, dtype=bool)
+    disability = u_disability < np.clip(0.1 + 0.02 * (ltc_state), 0, 0.7)
+    hospitalised = np.zeros(n, dtype=np.int8)
+    alive = np.ones(n, dtype=np.int8)
+    care_home = np.zeros(n, dtype=np.int8)
 
     cohort = Cohort(
-        data={
+        data=pack_columns({
             "age": ages,
             "sex": sex,
             "region": region,
-            "imd_quintile": imd.astype(int),
+            "imd_quintile": imd.astype(np.int8),
             "urban_rural": urban_rural,
-            "ltc_state": ltc_state.astype(int),
-            "disability": disability.astype(int),
-            "hospitalised": hospitalised.astype(int),
-            "alive": alive.astype(int),
-            "care_home": care_home.astype(int),
+            "ltc_state": ltc_state,
+            "disability": disability.astype(np.int8),
+            "hospitalised": hospitalised,
+            "alive": alive,
+            "care_home": care_home,
             "gp_access": service_gp,
             "community_capacity": service_comm,
             "heat_exposure": heat,
             "cold_exposure": cold,
-            "hospital_beds_per_1k": np.full(n, cfg.care_capacity.get("hospital_beds_per_1k", 3.0)),
-            "care_home_beds_per_1k": np.full(n, cfg.care_capacity.get("care_home_beds_per_1k", 5.0)),
-        }
+        }),
+        params=baseline_cohort_params(cfg),
+        categories={
+            "sex": sex_categories,
+            "region": region_categories,
+            "urban_rural": urban_rural_categories,
+        },
     )
     return cohort
 
 
-__all__ = ["create_baseline_cohort"]
+__all__ = ["baseline_cohort_params", "create_baseline_cohort"]
@@ -14,13 +14,14 @@ def capacity_feedback(
     modifiers: Dict[str, float] | None = None,
 ) -> Dict[str, float]:
     modifiers = modifiers or {}
-    hospitalised = cohort.data["hospitalised"].astype(bool)
-    care_home = cohort.data["care_home"].astype(bool)
-    hospital_beds = cohort.data["hospital_beds_per_1k"].mean()
-    care_beds = cohort.data["care_home_beds_per_1k"].mean()
-
-    hospital_occupancy = hospitalised.mean() * 1000 / max(hospital_beds, 0.1)
-    care_occupancy = care_home.mean() * 1000 / max(care_beds, 0.1)
+    # Flags are stored as 0/1 integers, so their mean is already the occupied fraction.
+    hospital_frac = cohort.data["hospitalised"].mean()
+    care_frac = cohort.data["care_home"].mean()
+    hospital_beds = cohort.params.get("hospital_beds_per_1k", 3.0)
+    care_beds = cohort.params.get("care_home_beds_per_1k", 5.0)
+
+    hospital_occupancy = hospital_frac * 1000 / max(hospital_beds, 0.1)
+    care_occupancy = care_frac * 1000 / max(care_beds, 0.1)
 
     hospital_pressure = max(0.0, hospital_occupancy - 1.0)
     care_pressure = max(0.0, care_occupancy - 1.0)
@@ -1,23 +1,79 @@
 """Simulation engine for Ageing Futures."""
 from __future__ import annotations
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
-from typing import Dict, List, Mapping, Tuple
+from typing import Dict, List, Mapping, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    from joblib import Parallel, delayed
+except ModuleNotFoundError:  # pragma: no cover - joblib is optional; fall back to a process pool
+    Parallel = None  # type: ignore
+    delayed = None  # type: ignore
+
+from ._jit import HAVE_NUMBA, njit, prange
 from .baseline import create_baseline_cohort
 from .capacity import capacity_feedback
-from .hazards import log_linear_predictor, log_hazard_to_probability
-from .policies import aggregate_policy_effects, build_active_policies, calculate_policy_cost
+from .hazards import log_hazard_to_probability
+from .policies import build_policy_schedule, calculate_policy_cost
 from .scoring import score_round
 from .shocks import Shock, active_shock_modifiers
 from .states import Cohort, SimulationTimestepResult
-from .utils import ConfigBundle, load_config_bundle, rng
+from .utils import ConfigBundle, TransitionsConfig, load_config_bundle, rng
+
+
+TRANSITION_NAMES = (
+    "ltc_onset",
+    "ltc_progression",
+    "disability_onset",
+    "disability_recovery",
+    "hospitalisation",
+    "care_home",
+    "mortality",
+)
+FEATURE_NAMES = (
+    "age",
+    "imd_quintile",
+    "community_capacity",
+    "ltc_level",
+    "disability",
+    "heat_exposure",
+    "cold_exposure",
+    "hospitalised",
+)
+# One row per simulated month; field names match the monthly timeseries payload.
+MONTH_DTYPE = np.dtype(
+    [
+        ("month", "i4"),
+        ("incidence", "i4"),
+        ("hospital_admissions", "i4"),
+        ("bed_days", "f8"),
+        ("care_home_admissions", "i4"),
+        ("deaths", "i4"),
+        ("costs_gbp", "f8"),
+        ("qalys", "f8"),
+        ("disability_prevalence", "f8"),
+        ("equity_gap_disability", "f8"),
+    ]
+)
+# Per-agent state columns updated by the monthly step, stored as int8.
+_STATE_COLUMNS = ("ltc_state", "disability", "hospitalised", "care_home", "alive")
+# Uniform draws per agent per month: onset, progression, severe, disability onset,
+# disability recovery, hospitalisation, care home, mortality.
+_N_DRAWS = 8
 
 
 def _build_features(cohort: Cohort) -> Dict[str, np.ndarray]:
+    """Feature arrays for the linear predictors, aliasing the cohort's columns.
+
+    The state columns are updated in place by the month step, so the aliases
+    stay current for the whole round.
+    """
     data = cohort.data
     return {
         "age": data["age"],
@@ -31,26 +87,302 @@ def _build_features(cohort: Cohort) -> Dict[str, np.ndarray]:
     }
 
 
-def _probability_for_transition(
-    name: str,
-    features: Dict[str, np.ndarray],
-    intercept: float,
-    coefficients: Dict[str, float],
-    dt_months: float,
+def _coefficient_matrix(transitions_cfg: TransitionsConfig) -> np.ndarray:
+    """Per-agent feature coefficients as a ``(transitions, features)`` matrix."""
+    coefs = np.zeros((len(TRANSITION_NAMES), len(FEATURE_NAMES)))
+    for row, name in enumerate(TRANSITION_NAMES):
+        coefficients = transitions_cfg.transitions[name].coefficients
+        for col, feature in enumerate(FEATURE_NAMES):
+            coefs[row, col] = coefficients.get(feature, 0.0)
+    return coefs
+
+
+def _modifier_coefficients(transitions_cfg: TransitionsConfig) -> Tuple[List[str], np.ndarray]:
+    """Coefficients for modifiers that enter the model as cohort-wide constants.
+
+    Any coefficient that is not a per-agent feature (and not a ``capacity_*`` key) is
+    fed by a policy or shock modifier of the same name. Its contribution,
+    ``coefficient * value``, is the same for every agent, so it is folded into
+    the intercept instead of being broadcast to an N-sized array.
+    """
+    names: List[str] = []
+    for transition in TRANSITION_NAMES:
+        for key in transitions_cfg.transitions[transition].coefficients:
+            if key in FEATURE_NAMES or key.startswith("capacity_") or key in names:
+                continue
+            names.append(key)
+    coefs = np.zeros((len(TRANSITION_NAMES), len(names)))
+    for row, transition in enumerate(TRANSITION_NAMES):
+        coefficients = transitions_cfg.transitions[transition].coefficients
+        for col, key in enumerate(names):
+            coefs[row, col] = coefficients.get(key, 0.0)
+    return names, coefs
+
+
+def _transition_intercepts(
+    base_intercepts: np.ndarray,
+    modifier_names: Sequence[str],
+    modifier_coefs: np.ndarray,
     policy_modifiers: Dict[str, float],
     shock_modifiers: Dict[str, float],
 ) -> np.ndarray:
-    alive_mask = features["age"] * 0 + 1.0  # placeholder to get shape
-    intercept_shift = policy_modifiers.get(name, 0.0) + shock_modifiers.get(name, 0.0)
-    combined_features = dict(features)
-    for source in (policy_modifiers, shock_modifiers):
-        for key, value in source.items():
-            if key.startswith("capacity_"):
+    """Intercepts with policy/shock shifts and constant modifier features folded in.
+
+    Policy values take precedence over shock values for the same modifier.
+    """
+    shifts = np.array(
+        [policy_modifiers.get(name, 0.0) + shock_modifiers.get(name, 0.0) for name in TRANSITION_NAMES]
+    )
+    intercepts = base_intercepts + shifts
+    if modifier_names:
+        values = np.array(
+            [policy_modifiers.get(key, shock_modifiers.get(key, 0.0)) for key in modifier_names]
+        )
+        intercepts += modifier_coefs @ values
+    return intercepts
+
+
+def _sample_length_of_stay(gen: np.random.Generator, mean_days: float, size: int) -> np.ndarray:
+    """Hospital stays of at least one day from Gamma(mean / 2, scale=2).
+
+    Uses the Wilson-Hilferty cube transform of standard normals rather than
+    NumPy's rejection sampler; the mean shifts with bed occupancy every month, so a
+    fixed quantile table would not fit. The approximation is close for shapes
+    above ~1, well within the usual LOS range.
+    """
+    shape = max(mean_days / 2.0, 1e-6)
+    c = 1.0 / (9.0 * shape)
+    los = gen.standard_normal(size, dtype=np.float32)
+    los *= np.float32(np.sqrt(c))
+    los += np.float32(1.0 - c)
+    np.maximum(los, 0.0, out=los)
+    cube = los * los
+    cube *= los
+    cube *= np.float32(2.0 * shape)
+    np.maximum(cube, 1.0, out=cube)
+    return cube
+
+
+if HAVE_NUMBA:
+
+    @njit(fastmath=True, cache=True)
+    def _kernel_probability(intercepts, coefs, k, age, imd, community, ltc, dis, heat, cold, hosp, dt_years):
+        lp = (
+            intercepts[k]
+            + coefs[k, 0] * age
+            + coefs[k, 1] * imd
+            + coefs[k, 2] * community
+            + coefs[k, 3] * ltc
+            + coefs[k, 4] * dis
+            + coefs[k, 5] * heat
+            + coefs[k, 6] * cold
+            + coefs[k, 7] * hosp
+        )
+        return -np.expm1(-np.exp(lp) * dt_years)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _step_month(
+        age,
+        imd,
+        community,
+        heat,
+        cold,
+        ltc,
+        dis,
+        hosp,
+        care,
+        alive,
+        los_remaining,
+        intercepts,
+        coefs,
+        dt_years,
+        recovery_divisor,
+        mortality_multiplier,
+        discharge_days,
+        uniforms,
+        los_draws,
+    ):
+        """Fused monthly update: one pass per agent, state arrays mutated in place.
+
+        Probabilities use the month-start state, exactly as the NumPy path does, and
+        the transitions are applied in the same order.
+        """
+        incidence = 0
+        admissions = 0
+        care_admissions = 0
+        deaths = 0
+        bed_days = 0.0
+        for i in prange(age.shape[0]):
+            if not alive[i]:
                 continue
-            if key in coefficients and key not in combined_features:
-                combined_features[key] = np.full_like(alive_mask, value)
-    lp = log_linear_predictor(intercept + intercept_shift, coefficients, combined_features)
-    return log_hazard_to_probability(lp, dt_months)
+            x_age = age[i]
+            x_imd = imd[i]
+            x_comm = community[i]
+            x_ltc = ltc[i]
+            x_dis = 1.0 if dis[i] else 0.0
+            x_heat = heat[i]
+            x_cold = cold[i]
+            x_hosp = 1.0 if hosp[i] else 0.0
+
+            # LTC transitions
+            p_onset = _kernel_probability(intercepts, coefs, 0, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            p_progress = _kernel_probability(intercepts, coefs, 1, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            state = ltc[i]
+            if state == 0 and uniforms[0, i] < p_onset:
+                state = 1
+                incidence += 1
+            if state == 1 and uniforms[1, i] < p_progress:
+                state = 2
+            if state >= 2 and uniforms[2, i] < min(p_progress * 0.5, 1.0):
+                state = 3
+            ltc[i] = state
+
+            # Disability transitions
+            p_disability = _kernel_probability(intercepts, coefs, 2, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            p_recovery = _kernel_probability(intercepts, coefs, 3, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            disabled = dis[i]
+            if not disabled and uniforms[3, i] < p_disability:
+                disabled = True
+            if disabled and uniforms[4, i] < p_recovery / recovery_divisor:
+                disabled = False
+
+            # Hospitalisation, length of stay and discharge
+            p_hospital = _kernel_probability(intercepts, coefs, 4, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            in_hospital = hosp[i]
+            if not in_hospital and uniforms[5, i] < p_hospital:
+                in_hospital = True
+                admissions += 1
+                los_remaining[i] = los_draws[i]
+                bed_days += los_draws[i]
+            if in_hospital:
+                remaining = max(0.0, los_remaining[i] - discharge_days)
+                los_remaining[i] = remaining
+                if remaining <= 0.0:
+                    in_hospital = False
+
+            # Care home admissions (only for disabled severe)
+            p_care = _kernel_probability(intercepts, coefs, 5, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            in_care = care[i]
+            if not in_care and disabled and state >= 2 and uniforms[6, i] < p_care:
+                in_care = True
+                care_admissions += 1
+
+            # Mortality
+            p_death = _kernel_probability(intercepts, coefs, 6, x_age, x_imd, x_comm, x_ltc, x_dis, x_heat, x_cold, x_hosp, dt_years)
+            if uniforms[7, i] < min(max(p_death * mortality_multiplier, 0.0), 1.0):
+                alive[i] = False
+                in_hospital = False
+                in_care = False
+                disabled = False
+                deaths += 1
+
+            dis[i] = disabled
+            hosp[i] = in_hospital
+            care[i] = in_care
+        return incidence, admissions, care_admissions, deaths, bed_days
+
+
+def _step_month_numpy(
+    features: Dict[str, np.ndarray],
+    ltc_state: np.ndarray,
+    disability: np.ndarray,
+    hospitalised: np.ndarray,
+    care_home: np.ndarray,
+    alive: np.ndarray,
+    hospital_los_remaining: np.ndarray,
+    intercepts: np.ndarray,
+    coef_matrix: np.ndarray,
+    dt_months: float,
+    capacity_modifiers: Dict[str, float],
+    uniforms: np.ndarray,
+    los_draws: np.ndarray,
+) -> Tuple[int, int, int, int, float]:
+    """Advance the state arrays in place by one month; returns the month's event counts.
+
+    ``uniforms`` holds the month's ``(_N_DRAWS, N)`` draws and ``los_draws`` a length of
+    stay per agent, the same inputs the fused kernel consumes. Only living agents are
+    gathered and stepped, so the work shrinks as the cohort dies.
+    """
+    idx = np.flatnonzero(alive)
+    u = uniforms[:, idx]
+    ltc = ltc_state[idx]
+    dis = disability[idx]
+    hosp = hospitalised[idx]
+    care = care_home[idx]
+    los_remaining = hospital_los_remaining[idx]
+
+    # All transition linear predictors in one (transitions, features) @ (features, alive) product.
+    feature_matrix = np.stack([features[name][idx] for name in FEATURE_NAMES])
+    lp = intercepts[:, None] + coef_matrix @ feature_matrix
+    (
+        onset_probs,
+        progression_probs,
+        disability_probs,
+        recovery_probs,
+        hospital_probs,
+        care_probs,
+        mortality_probs,
+    ) = log_hazard_to_probability(lp, dt_months)
+
+    # LTC transitions
+    severe_probs = np.clip(progression_probs * 0.5, 0.0, 1.0)
+
+    onset_mask = (ltc == 0) & (u[0] < onset_probs)
+    ltc[onset_mask] = 1
+    new_incidence = np.count_nonzero(onset_mask)
+
+    progress_mask = (ltc == 1) & (u[1] < progression_probs)
+    ltc[progress_mask] = 2
+
+    severe_mask = (ltc >= 2) & (u[2] < severe_probs)
+    ltc[severe_mask] = 3
+
+    # Disability transitions
+    recovery_probs = recovery_probs / max(capacity_modifiers.get("disability_persistence", 1.0), 1e-6)
+
+    disability_onset = (~dis) & (u[3] < disability_probs)
+    dis[disability_onset] = True
+
+    disability_recover = dis & (u[4] < recovery_probs)
+    dis[disability_recover] = False
+
+    # Hospitalisation transitions
+    new_admissions_mask = (~hosp) & (u[5] < hospital_probs)
+    new_hospital = np.count_nonzero(new_admissions_mask)
+    hosp[new_admissions_mask] = True
+    los = los_draws[idx[new_admissions_mask]]
+    los_remaining[new_admissions_mask] = los
+    bed_days = float(los.sum())
+
+    # Stays outside hospital are overwritten on admission, so decrement every slot in place.
+    np.subtract(los_remaining, dt_months * 30, out=los_remaining)
+    np.maximum(los_remaining, 0.0, out=los_remaining)
+    discharged = hosp & (los_remaining <= 0.0)
+    hosp[discharged] = False
+
+    # Care home admissions (only for disabled severe)
+    care_mask = (~care) & dis & (ltc >= 2) & (u[6] < care_probs)
+    care[care_mask] = True
+    new_care = np.count_nonzero(care_mask)
+
+    # Mortality
+    mortality_probs = np.clip(
+        mortality_probs * capacity_modifiers.get("mortality_multiplier", 1.0), 0.0, 1.0
+    )
+    death_mask = u[7] < mortality_probs
+    new_deaths = np.count_nonzero(death_mask)
+    hosp[death_mask] = False
+    care[death_mask] = False
+    dis[death_mask] = False
+
+    ltc_state[idx] = ltc
+    disability[idx] = dis
+    hospitalised[idx] = hosp
+    care_home[idx] = care
+    hospital_los_remaining[idx] = los_remaining
+    alive[idx[death_mask]] = False
+
+    return new_incidence, new_hospital, new_care, new_deaths, bed_days
 
 
 def simulate_round(
@@ -73,198 +405,108 @@ def simulate_round(
     dt_years = dt_months / 12.0
 
     cohort = cohort.copy()
+    for name in _STATE_COLUMNS:
+        if cohort.data[name].dtype != np.int8:
+            cohort.data[name] = cohort.data[name].astype(np.int8)
     features = _build_features(cohort)
-    alive = cohort.data["alive"].astype(bool)
-    ltc_state = cohort.data["ltc_state"].astype(int)
-    disability = cohort.data["disability"].astype(bool)
-    hospitalised = cohort.data["hospitalised"].astype(bool)
-    care_home = cohort.data["care_home"].astype(bool)
+    # State flags are 0/1 int8 columns; bool views of them are zero-copy masks.
+    ltc_state = cohort.data["ltc_state"]
+    alive = cohort.data["alive"].view(np.bool_)
+    disability = cohort.data["disability"].view(np.bool_)
+    hospitalised = cohort.data["hospitalised"].view(np.bool_)
+    care_home = cohort.data["care_home"].view(np.bool_)
 
     hospital_los_remaining = np.zeros(cohort.size, dtype=float)
 
-    policy_counters = {policy_id: policy_months_active.get(policy_id, 0) if policy_months_active else 0 for policy_id in (decisions or {})}
+    policy_schedule = build_policy_schedule(policies_cfg, decisions, policy_months_active)
 
     active_shocks = shocks or []
     shock_mods = active_shock_modifiers(active_shocks)
 
     timestep_results: List[SimulationTimestepResult] = []
-    monthly_records = []
+    monthly = np.empty(months, dtype=MONTH_DTYPE)
 
     base_los = transitions_cfg.length_of_stay.get("hospital").mean if "hospital" in transitions_cfg.length_of_stay else 7.0
+    coef_matrix = _coefficient_matrix(transitions_cfg)
+    # Config values read every month, pulled out of the pydantic models once per round.
+    base_intercepts = np.array([transitions_cfg.transitions[name].intercept for name in TRANSITION_NAMES])
+    modifier_names, modifier_coefs = _modifier_coefficients(transitions_cfg)
+    qaly_table, disability_factor = _qaly_weight_table(costs_cfg.qaly_weights)
+    bed_day_cost = costs_cfg.unit_costs.get("hospital_bed_day", 0.0)
+    care_home_day_cost = costs_cfg.unit_costs.get("care_home_day", 0.0)
+    policy_cost = calculate_policy_cost(policies_cfg, decisions, cohort.size) / max(months, 1)
 
     for month in range(months):
-        alive_mask = alive.astype(float)
-        features.update({
-            "ltc_level": ltc_state.astype(float),
-            "disability": disability.astype(float),
-            "hospitalised": hospitalised.astype(float),
-        })
-
-        active = build_active_policies(policies_cfg, decisions, policy_counters)
-        policy_modifiers = aggregate_policy_effects(active.values())
+        policy_modifiers = policy_schedule.modifiers(month)
         capacity_modifiers = capacity_feedback(cohort, base_los, policy_modifiers | shock_mods)
 
-        metrics = {"month": month + 1}
-        new_incidence = 0
-        new_hospital = 0
-        new_care = 0
-        new_deaths = 0
-        bed_days = 0.0
-
-        # LTC transitions
-        onset_probs = _probability_for_transition(
-            "ltc_onset",
-            features,
-            transitions_cfg.transitions["ltc_onset"].intercept,
-            transitions_cfg.transitions["ltc_onset"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-        progression_probs = _probability_for_transition(
-            "ltc_progression",
-            features,
-            transitions_cfg.transitions["ltc_progression"].intercept,
-            transitions_cfg.transitions["ltc_progression"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-
-        severe_probs = np.clip(progression_probs * 0.5, 0.0, 1.0)
-
-        draw = gen.random(cohort.size)
-        onset_mask = (ltc_state == 0) & (draw < onset_probs)
-        ltc_state[onset_mask] = 1
-        new_incidence += onset_mask.sum()
-
-        draw = gen.random(cohort.size)
-        progress_mask = (ltc_state == 1) & (draw < progression_probs)
-        ltc_state[progress_mask] = 2
-
-        draw = gen.random(cohort.size)
-        severe_mask = (ltc_state >= 2) & (draw < severe_probs)
-        ltc_state[severe_mask] = 3
-
-        # Disability transitions
-        disability_probs = _probability_for_transition(
-            "disability_onset",
-            features,
-            transitions_cfg.transitions["disability_onset"].intercept,
-            transitions_cfg.transitions["disability_onset"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-
-        recovery_probs = _probability_for_transition(
-            "disability_recovery",
-            features,
-            transitions_cfg.transitions["disability_recovery"].intercept,
-            transitions_cfg.transitions["disability_recovery"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-        recovery_probs = recovery_probs / max(capacity_modifiers.get("disability_persistence", 1.0), 1e-6)
-
-        draw = gen.random(cohort.size)
-        disability_onset = (~disability) & (draw < disability_probs)
-        disability[disability_onset] = True
-
-        draw = gen.random(cohort.size)
-        disability_recover = disability & (draw < recovery_probs)
-        disability[disability_recover] = False
-
-        # Hospitalisation transitions
-        hospital_probs = _probability_for_transition(
-            "hospitalisation",
-            features,
-            transitions_cfg.transitions["hospitalisation"].intercept,
-            transitions_cfg.transitions["hospitalisation"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-
-        new_admissions_mask = (~hospitalised) & (gen.random(cohort.size) < hospital_probs)
-        new_hospital += new_admissions_mask.sum()
-        hospitalised[new_admissions_mask] = True
-        los_mean = capacity_modifiers["length_of_stay"]
-        los = np.maximum(1.0, gen.gamma(shape=los_mean / 2.0, scale=2.0, size=new_admissions_mask.sum()))
-        hospital_los_remaining[new_admissions_mask] = los
-        bed_days += float(los.sum())
-
-        hospital_los_remaining[hospitalised] = np.maximum(0.0, hospital_los_remaining[hospitalised] - dt_months * 30)
-        discharged = hospitalised & (hospital_los_remaining <= 0.0)
-        hospitalised[discharged] = False
-
-        # Care home admissions (only for disabled severe)
-        care_probs = _probability_for_transition(
-            "care_home",
-            features,
-            transitions_cfg.transitions["care_home"].intercept,
-            transitions_cfg.transitions["care_home"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-        care_mask = (~care_home) & disability & (ltc_state >= 2) & (gen.random(cohort.size) < care_probs)
-        care_home[care_mask] = True
-        new_care += care_mask.sum()
-
-        # Mortality
-        mortality_probs = _probability_for_transition(
-            "mortality",
-            features,
-            transitions_cfg.transitions["mortality"].intercept,
-            transitions_cfg.transitions["mortality"].coefficients,
-            dt_months,
-            policy_modifiers,
-            shock_mods,
-        ) * alive_mask
-        mortality_probs = np.clip(
-            mortality_probs * capacity_modifiers.get("mortality_multiplier", 1.0), 0.0, 1.0
+        intercepts = _transition_intercepts(
+            base_intercepts, modifier_names, modifier_coefs, policy_modifiers, shock_mods
         )
-        death_mask = alive & (gen.random(cohort.size) < mortality_probs)
-        new_deaths += death_mask.sum()
-        alive[death_mask] = False
-        hospitalised[death_mask] = False
-        care_home[death_mask] = False
-        disability[death_mask] = False
-
-        # Update cohort arrays
-        cohort.data["age"] = cohort.data["age"] + dt_months / 12.0
-        cohort.data["ltc_state"] = ltc_state.astype(int)
-        cohort.data["disability"] = disability.astype(int)
-        cohort.data["hospitalised"] = hospitalised.astype(int)
-        cohort.data["care_home"] = care_home.astype(int)
-        cohort.data["alive"] = alive.astype(int)
-        features = _build_features(cohort)
-
-        disability_prev = (disability & alive).sum() / max(alive.sum(), 1)
-        qalys = _calculate_qalys(ltc_state, disability, alive, costs_cfg.qaly_weights, dt_years)
-        policy_cost = calculate_policy_cost(policies_cfg, decisions, cohort.size) / max(months, 1)
-        hospital_cost = bed_days * costs_cfg.unit_costs.get("hospital_bed_day", 0.0)
-        care_cost = care_home.sum() * 30 * costs_cfg.unit_costs.get("care_home_day", 0.0)
+        # One batched draw per month; each agent's LOS is pre-drawn and used only on admission.
+        uniforms = gen.random((_N_DRAWS, cohort.size), dtype=np.float32)
+        los_draws = _sample_length_of_stay(gen, capacity_modifiers["length_of_stay"], cohort.size)
+        if HAVE_NUMBA:
+            new_incidence, new_hospital, new_care, new_deaths, bed_days = _step_month(
+                cohort.data["age"],
+                cohort.data["imd_quintile"],
+                cohort.data["community_capacity"],
+                cohort.data["heat_exposure"],
+                cohort.data["cold_exposure"],
+                ltc_state,
+                disability,
+                hospitalised,
+                care_home,
+                alive,
+                hospital_los_remaining,
+                intercepts,
+                coef_matrix,
+                dt_years,
+                max(capacity_modifiers.get("disability_persistence", 1.0), 1e-6),
+                capacity_modifiers.get("mortality_multiplier", 1.0),
+                dt_months * 30.0,
+                uniforms,
+                los_draws,
+            )
+        else:
+            new_incidence, new_hospital, new_care, new_deaths, bed_days = _step_month_numpy(
+                features,
+                ltc_state,
+                disability,
+                hospitalised,
+                care_home,
+                alive,
+                hospital_los_remaining,
+                intercepts,
+                coef_matrix,
+                dt_months,
+                capacity_modifiers,
+                uniforms,
+                los_draws,
+            )
+
+        # State columns were updated in place through their aliases; only age advances here.
+        np.add(cohort.data["age"], dt_years, out=cohort.data["age"])
+
+        disability_prev = np.count_nonzero(disability & alive) / max(np.count_nonzero(alive), 1)
+        qalys = _calculate_qalys(ltc_state, disability, alive, qaly_table, disability_factor, dt_years)
+        hospital_cost = bed_days * bed_day_cost
+        care_cost = np.count_nonzero(care_home) * 30 * care_home_day_cost
         total_cost = policy_cost + hospital_cost + care_cost
 
-        equity_gap = _imd_gap(disability.astype(int), cohort.data["imd_quintile"], alive)
-        metrics.update(
-            {
-                "incidence": new_incidence,
-                "hospital_admissions": new_hospital,
-                "bed_days": bed_days,
-                "care_home_admissions": new_care,
-                "deaths": new_deaths,
-                "costs_gbp": total_cost,
-                "qalys": qalys,
-                "disability_prevalence": disability_prev,
-                "equity_gap_disability": equity_gap,
-            }
+        equity_gap = _imd_gap(disability, cohort.data["imd_quintile"], alive)
+        monthly[month] = (
+            month + 1,
+            new_incidence,
+            new_hospital,
+            bed_days,
+            new_care,
+            new_deaths,
+            total_cost,
+            qalys,
+            disability_prev,
+            equity_gap,
         )
-
-        monthly_records.append(metrics)
         timestep_results.append(
             SimulationTimestepResult(
                 month_index=month + 1,
@@ -280,68 +522,134 @@ def simulate_round(
             )
         )
 
-        for policy_id in policy_counters:
-            if decisions and policy_id in decisions:
-                if decisions[policy_id].get("intensity", 0) > 0:
-                    policy_counters[policy_id] += 1
-
     cohort.months_elapsed += months
 
-    summary = _summarise_round(monthly_records)
+    summary = _summarise_round(monthly)
     leaderboard = _build_leaderboard(summary, scoring_cfg)
 
     return cohort, timestep_results, summary, leaderboard
 
 
-def _calculate_qalys(
-    ltc_state: np.ndarray,
-    disability: np.ndarray,
-    alive: np.ndarray,
-    weights: Dict[str, float],
-    dt_years: float,
-) -> float:
-    base = np.select(
-        [ltc_state == 0, ltc_state == 1, ltc_state == 2, ltc_state >= 3],
+def timesteps_frame(timesteps: Sequence[SimulationTimestepResult]) -> pd.DataFrame:
+    """Monthly results as one column per ``MONTH_DTYPE`` field, built in a single pass."""
+    columns = ["month_index", *MONTH_DTYPE.names[1:-1], "equity_gaps"]
+    frame = pd.DataFrame([result.__dict__ for result in timesteps], columns=columns)
+    frame["equity_gap_disability"] = frame.pop("equity_gaps").map(
+        lambda gaps: gaps.get("disability", 0.0)
+    ).astype(np.float64)
+    return frame.rename(columns={"month_index": "month"})
+
+
+def run_team_round(
+    cohort: Cohort,
+    months: int,
+    decisions: Mapping[str, Dict[str, float]] | None,
+    shocks: List[Shock] | None,
+    config_bundle: ConfigBundle,
+    seed: int,
+) -> Tuple[Cohort, List[SimulationTimestepResult], Dict[str, float]]:
+    """Process-pool entry point for one team's round.
+
+    Same as :func:`simulate_round` but drops the single-team leaderboard frame,
+    which callers scoring across teams never use, so less is pickled back.
+    """
+    cohort, timesteps, summary, _ = simulate_round(cohort, months, decisions, shocks, config_bundle, seed)
+    return cohort, timesteps, summary
+
+
+def spawn_seeds(root_seed: int, count: int) -> List[np.random.SeedSequence]:
+    """Independent child seeds for ``count`` runs derived from one root seed."""
+    return np.random.SeedSequence(root_seed).spawn(count)
+
+
+def simulate_rounds_batch(
+    cohort: Cohort,
+    months: int,
+    decisions: Mapping[str, Dict[str, float]] | None,
+    shocks: List[Shock] | None,
+    seeds: Sequence[int | np.random.SeedSequence],
+    config_bundle: ConfigBundle | None = None,
+    policy_months_active: Mapping[str, int] | None = None,
+    n_jobs: int = -1,
+) -> List[Tuple[Cohort, List[SimulationTimestepResult], Dict[str, float], pd.DataFrame]]:
+    """Run :func:`simulate_round` once per seed, in parallel worker processes.
+
+    Runs are independent given their seed, so results match sequential calls and
+    come back in ``seeds`` order. Use :func:`spawn_seeds` for uncorrelated streams.
+    ``n_jobs=-1`` uses every CPU; ``n_jobs=1`` runs in-process.
+    """
+    bundle = config_bundle or load_config_bundle()
+    args = [(cohort, months, decisions, shocks, bundle, seed, policy_months_active) for seed in seeds]
+    if n_jobs == 1 or len(args) <= 1:
+        return [simulate_round(*item) for item in args]
+    if Parallel is not None:
+        return Parallel(n_jobs=n_jobs)(delayed(simulate_round)(*item) for item in args)
+    workers = os.cpu_count() if n_jobs < 0 else n_jobs
+    # Spawned (not forked) workers, as with joblib's loky backend: forking after the
+    # Numba thread pool has started can deadlock the child.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers or 1, len(args)), mp_context=context) as pool:
+        return list(pool.map(simulate_round, *zip(*args)))
+
+
+def _qaly_weight_table(weights: Dict[str, float]) -> Tuple[np.ndarray, float]:
+    """QALY weight per LTC tier and the multiplier applied for disability."""
+    table = np.array(
         [
             weights.get("healthy", 0.9),
             weights.get("ltc_mild", 0.8),
             weights.get("ltc_moderate", 0.65),
             weights.get("ltc_severe", 0.45),
-        ],
-        default=0.5,
+        ]
     )
     disability_factor = weights.get("disability", 0.5) / max(weights.get("healthy", 0.9), 1e-6)
+    return table, disability_factor
+
+
+def _calculate_qalys(
+    ltc_state: np.ndarray,
+    disability: np.ndarray,
+    alive: np.ndarray,
+    weight_table: np.ndarray,
+    disability_factor: float,
+    dt_years: float,
+) -> float:
+    base = weight_table[np.minimum(ltc_state, 3)]
     adjusted = base * np.where(disability, disability_factor, 1.0)
-    adjusted = adjusted * alive.astype(float)
-    return float(adjusted.sum() * dt_years)
+    return float(np.dot(adjusted, alive) * dt_years)
 
 
 def _imd_gap(disability: np.ndarray, imd: np.ndarray, alive: np.ndarray) -> float:
-    mask_alive = alive.astype(bool)
-    if mask_alive.sum() == 0:
+    """Disability prevalence gap between the highest and lowest IMD quintile present.
+
+    ``alive`` must be a boolean mask.
+    """
+    imd_alive = imd[alive].astype(np.intp)
+    if imd_alive.size == 0:
         return 0.0
-    data = pd.DataFrame({"imd": imd[mask_alive], "disability": disability[mask_alive]})
-    q1 = data[data["imd"] == data["imd"].min()]["disability"].mean()
-    q5 = data[data["imd"] == data["imd"].max()]["disability"].mean()
-    return float(q5 - q1)
+    counts = np.bincount(imd_alive)
+    sums = np.bincount(imd_alive, weights=disability[alive])
+    present = np.flatnonzero(counts)
+    lowest, highest = present[0], present[-1]
+    return float(sums[highest] / counts[highest] - sums[lowest] / counts[lowest])
 
 
-def _summarise_round(monthly_records: List[Dict[str, float]]) -> Dict[str, float]:
-    df = pd.DataFrame(monthly_records)
+def _summarise_round(monthly: np.ndarray) -> Dict[str, float]:
+    last = monthly[-1]
     summary = {
-        "incidence_total": float(df["incidence"].sum()),
-        "hospital_admissions_total": float(df["hospital_admissions"].sum()),
-        "bed_days_total": float(df["bed_days"].sum()),
-        "care_home_admissions_total": float(df["care_home_admissions"].sum()),
-        "deaths_total": float(df["deaths"].sum()),
-        "costs_total": float(df["costs_gbp"].sum()),
-        "qalys_total": float(df["qalys"].sum()),
-        "disability_prev_end": float(df["disability_prevalence"].iloc[-1]),
-        "equity_gap_disability": float(df["equity_gap_disability"].iloc[-1]),
-        "health_value": float(df["qalys"].sum()),
-        "cost_value": float(df["costs_gbp"].sum()),
-        "capacity_value": float(-df["bed_days"].sum()),
-        "equity_value": -abs(float(df["equity_gap_disability"].iloc[-1])),
+        "incidence_total": float(monthly["incidence"].sum()),
+        "hospital_admissions_total": float(monthly["hospital_admissions"].sum()),
+        "bed_days_total": float(monthly["bed_days"].sum()),
+        "care_home_admissions_total": float(monthly["care_home_admissions"].sum()),
+        "deaths_total": float(monthly["deaths"].sum()),
+        "costs_total": float(monthly["costs_gbp"].sum()),
+        "qalys_total": float(monthly["qalys"].sum()),
+        "disability_prev_end": float(last["disability_prevalence"]),
+        "equity_gap_disability": float(last["equity_gap_disability"]),
+        "health_value": float(monthly["qalys"].sum()),
+        "cost_value": float(monthly["costs_gbp"].sum()),
+        "capacity_value": float(-monthly["bed_days"].sum()),
+        "equity_value": -abs(float(last["equity_gap_disability"])),
     }
     return summary
 
@@ -360,4 +668,11 @@ def _build_leaderboard(summary: Dict[str, float], scoring_cfg) -> pd.DataFrame:
     return scored
 
 
-__all__ = ["simulate_round", "create_baseline_cohort"]
+__all__ = [
+    "simulate_round",
+    "simulate_rounds_batch",
+    "spawn_seeds",
+    "run_team_round",
+    "timesteps_frame",
+    "create_baseline_cohort",
+]
@@ -25,22 +25,25 @@ def hazard_to_probability(hazard: np.ndarray, dt_months: float) -> np.ndarray:
 
 
 def log_hazard_to_probability(lp: np.ndarray, dt_months: float) -> np.ndarray:
-    hazard = np.exp(lp)
-    return hazard_to_probability(hazard, dt_months)
+    # exp(lp) is never negative, so no clipping is needed; -expm1(-x) is the
+    # numerically stable form of 1 - exp(-x) for small hazards.
+    probability = np.asarray(np.exp(lp))
+    probability *= -(dt_months / 12.0)
+    np.expm1(probability, out=probability)
+    np.negative(probability, out=probability)
+    return probability
 
 
 def ensure_competing_risk(probabilities: list[np.ndarray]) -> list[np.ndarray]:
-    total = np.zeros_like(probabilities[0])
-    for arr in probabilities:
-        total += arr
-    excess = np.maximum(total - 1.0, 0.0)
-    if float(np.max(excess)) <= 1e-8:
+    stacked = np.stack(probabilities)
+    total = stacked.sum(axis=0)
+    if float(np.max(total)) - 1.0 <= 1e-8:
         return probabilities
-    # Rescale to keep sum <= 1
-    adjusted = []
-    for arr in probabilities:
-        adjusted.append(np.clip(arr - excess * (arr / (total + 1e-12)), 0.0, 1.0))
-    return adjusted
+    # Rescale so the risks sum to one wherever they exceed it
+    over = total > 1.0
+    stacked[:, over] /= total[over]
+    np.clip(stacked, 0.0, 1.0, out=stacked)
+    return list(stacked)
 
 
 __all__ = [
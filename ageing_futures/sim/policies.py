@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping
+from typing import Dict, Iterable, List, Mapping
 
 import numpy as np
 
@@ -61,6 +61,52 @@ def aggregate_policy_effects(active: Iterable[ActivePolicy]) -> Dict[str, float]
     return modifiers
 
 
+@dataclass
+class PolicySchedule:
+    """Month-invariant policy terms for one round; only the ramp changes month to month."""
+
+    effects: List[Dict[str, float]]
+    intensities: np.ndarray  # clipped to [0, 1]
+    multipliers: np.ndarray  # diminishing-return multipliers
+    lags: np.ndarray
+    start_months: np.ndarray
+    increments: np.ndarray  # 1 where the policy accrues active months, else 0
+
+    def modifiers(self, month: int) -> Dict[str, float]:
+        """Aggregated policy modifiers ``month`` months into the round."""
+        months_active = self.start_months + month * self.increments
+        effective_months = months_active - self.lags
+        ramps = np.where(effective_months > 0, np.clip(1.0 - np.exp(-effective_months / 6.0), 0.0, 1.0), 0.0)
+        strengths = self.intensities * ramps * self.multipliers
+        modifiers: Dict[str, float] = {}
+        for effects, strength in zip(self.effects, strengths.tolist()):
+            if strength <= 0:
+                continue
+            for key, value in effects.items():
+                modifiers[key] = modifiers.get(key, 0.0) + value * strength
+        return modifiers
+
+
+def build_policy_schedule(
+    policies_cfg: PoliciesConfig,
+    decisions: Mapping[str, Dict[str, float]] | None,
+    months_elapsed: Mapping[str, int] | None = None,
+) -> PolicySchedule:
+    """Precompute what :func:`aggregate_policy_effects` needs for every month of a round."""
+    active = build_active_policies(policies_cfg, decisions, months_elapsed)
+    policies = list(active.values())
+    return PolicySchedule(
+        effects=[item.policy.effects for item in policies],
+        intensities=np.array([np.clip(item.intensity, 0.0, 1.0) for item in policies], dtype=float),
+        multipliers=np.array([item.diminishing_multiplier() for item in policies], dtype=float),
+        lags=np.array([max(item.policy.lag_months, 0) for item in policies], dtype=int),
+        start_months=np.array([item.months_active for item in policies], dtype=int),
+        increments=np.array(
+            [int(decisions[policy_id].get("intensity", 0) > 0) for policy_id in active], dtype=int
+        ),
+    )
+
+
 def calculate_policy_cost(
     policies_cfg: PoliciesConfig,
     decisions: Mapping[str, Dict[str, float]] | None,
@@ -82,7 +128,9 @@ def calculate_policy_cost(
 
 __all__ = [
     "ActivePolicy",
+    "PolicySchedule",
     "build_active_policies",
+    "build_policy_schedule",
     "aggregate_policy_effects",
     "calculate_policy_cost",
 ]
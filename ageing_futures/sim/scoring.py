@@ -19,18 +19,20 @@ DIMENSION_DIRECTIONS = {
 
 
 def _normalise(series: pd.Series, method: str, direction: int) -> pd.Series:
-    values = series * direction
+    values = np.asarray(series, dtype=np.float64) * direction
+    if values.size == 0:
+        return pd.Series(values, index=series.index)
     if method == "zscore":
         mean = values.mean()
-        std = values.std(ddof=0)
+        std = values.std()
         if math.isclose(std, 0.0):
             return pd.Series(np.zeros(len(values)), index=series.index)
-        return (values - mean) / std
+        return pd.Series((values - mean) / std, index=series.index)
     min_val = values.min()
-    max_val = values.max()
-    if math.isclose(max_val, min_val):
+    spread = np.ptp(values)
+    if math.isclose(spread, 0.0):
         return pd.Series(np.zeros(len(values)), index=series.index)
-    return (values - min_val) / (max_val - min_val)
+    return pd.Series((values - min_val) / spread, index=series.index)
 
 
 def score_round(metrics: pd.DataFrame, scoring_cfg: ScoringConfig) -> pd.DataFrame:
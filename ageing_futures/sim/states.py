@@ -1,6 +1,8 @@
 """Core state enumerations and dataclasses for the Ageing Futures simulation."""
 from __future__ import annotations
 
+import base64
+import io
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional
@@ -17,15 +19,65 @@ class LTCState(int, Enum):
     SEVERE = 3  # 5+ LTCs
 
 
+def pack_columns(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Copy equal-length columns into one contiguous ``(fields, N)`` block per dtype.
+
+    The returned dict maps each name to a row view of its block, so callers keep
+    per-column access while same-typed fields share one allocation.
+    """
+    by_dtype: Dict[np.dtype, List[str]] = {}
+    for name, values in columns.items():
+        by_dtype.setdefault(np.asarray(values).dtype, []).append(name)
+    packed: Dict[str, np.ndarray] = {}
+    for dtype, names in by_dtype.items():
+        block = np.empty((len(names), len(columns[names[0]])), dtype=dtype)
+        for row, name in enumerate(names):
+            block[row] = columns[name]
+            packed[name] = block[row]
+    return {name: packed[name] for name in columns}
+
+
+def encode_cohort_state(columns: Dict[str, np.ndarray]) -> str:
+    """Serialise cohort columns as a base64 ``np.savez_compressed`` archive.
+
+    Keeps each column's dtype and is far smaller and faster to parse than
+    nested JSON lists, while still fitting in a JSON column.
+    """
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **columns)
+    return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def decode_cohort_state(payload: str) -> Dict[str, np.ndarray]:
+    """Inverse of :func:`encode_cohort_state`; returns packed columns."""
+    with np.load(io.BytesIO(base64.b64decode(payload)), allow_pickle=False) as archive:
+        return pack_columns({name: archive[name] for name in archive.files})
+
+
 @dataclass
 class Cohort:
-    """Container for synthetic cohort data."""
+    """Container for synthetic cohort data.
+
+    Columns in ``data`` are typically row views into contiguous per-dtype blocks
+    (see :func:`pack_columns`); state updates should write into them in place.
+    """
 
     data: Dict[str, np.ndarray]
     months_elapsed: int = 0
+    params: Dict[str, float] = field(default_factory=dict)  # cohort-wide scalars, e.g. bed capacity
+    categories: Dict[str, List[str]] = field(default_factory=dict)  # labels for coded columns
 
     def copy(self) -> "Cohort":
-        return Cohort({k: v.copy() for k, v in self.data.items()}, self.months_elapsed)
+        return Cohort(
+            pack_columns(self.data),
+            self.months_elapsed,
+            dict(self.params),
+            dict(self.categories),
+        )
+
+    def labels(self, name: str) -> np.ndarray:
+        """Decode a categorical column from its integer codes to string labels."""
+        return np.asarray(self.categories[name])[self.data[name]]
 
     @property
     def size(self) -> int:
@@ -4,7 +4,7 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -70,7 +70,7 @@ class ScoringConfig(BaseModel):
     normalisation: str = Field("zscore", regex="^(zscore|minmax)$")
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConfigBundle:
     baseline: BaselinePopulationConfig
     transitions: TransitionsConfig
@@ -78,7 +78,10 @@ class ConfigBundle:
     costs: CostsConfig
     scoring: ScoringConfig
 
-    def hash(self) -> str:
+    @cached_property
+    def _digest(self) -> str:
+        # Memoised on first use. The bundle is frozen and dataclasses.replace()
+        # builds a new instance, so a cached digest never outlives its fields.
         hasher = hashlib.sha256()
         for payload in (
             self.baseline.json(sort_keys=True),
@@ -90,6 +93,9 @@ class ConfigBundle:
             hasher.update(payload.encode("utf-8"))
         return hasher.hexdigest()
 
+    def hash(self) -> str:
+        return self._digest
+
 
 def _load_json(path: Path) -> Dict:
     with path.open("r", encoding="utf-8") as f:
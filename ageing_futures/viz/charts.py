@@ -7,6 +7,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
+try:
+    import streamlit as st
+except ModuleNotFoundError:  # pragma: no cover - charts are also built outside Streamlit
+    st = None  # type: ignore
+
 
 def time_series_chart(df: pd.DataFrame, metric: str, title: str, yaxis_title: str) -> go.Figure:
     fig = px.line(df, x="month", y=metric, markers=True, title=title)
@@ -45,4 +50,30 @@ def leaderboard_bar(df: pd.DataFrame) -> go.Figure:
     return fig
 
 
-__all__ = ["time_series_chart", "multi_metric_chart", "leaderboard_bar"]
+def _frame_key(df: pd.DataFrame) -> bytes:
+    """Content hash of a frame, including its column labels, for figure caching."""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes() + repr(list(df.columns)).encode("utf-8")
+
+
+if st is not None:
+    # Autorefreshing pages rebuild identical figures; reuse them while the data is unchanged.
+    _cache_figure = st.cache_data(show_spinner=False, max_entries=256, hash_funcs={pd.DataFrame: _frame_key})
+else:
+
+    def _cache_figure(func):
+        return func
+
+
+cached_time_series_chart = _cache_figure(time_series_chart)
+cached_multi_metric_chart = _cache_figure(multi_metric_chart)
+cached_leaderboard_bar = _cache_figure(leaderboard_bar)
+
+
+__all__ = [
+    "time_series_chart",
+    "multi_metric_chart",
+    "leaderboard_bar",
+    "cached_time_series_chart",
+    "cached_multi_metric_chart",
+    "cached_leaderboard_bar",
+]
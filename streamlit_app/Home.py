@@ -3,13 +3,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any, Dict
 
 import streamlit as st
-from sqlmodel import Session as DBSession
 
-from ageing_futures.db.connection import get_engine
-from ageing_futures.db import crud
-from ageing_futures.sim.utils import load_config_bundle
+from _cache import get_config_bundle
+from _data import get_sessions
 
 st.set_page_config(page_title="Ageing Futures", layout="wide")
 
@@ -34,25 +33,44 @@ with st.sidebar:
     st.page_link("pages/7_Printables.py", label="Printables", icon="🖨️")
 
 st.subheader("Default configuration snapshot")
-config = load_config_bundle()
+config = get_config_bundle()
+
+
+@st.cache_data(show_spinner=False)
+def default_config_dicts() -> Dict[str, Dict[str, Any]]:
+    """Plain-dict views of the default policies, transitions and costs, built once."""
+    bundle = get_config_bundle()
+    return {
+        "policies": bundle.policies.dict(),
+        "transitions": bundle.transitions.dict(),
+        "costs": bundle.costs.dict(),
+    }
+
+
 col1, col2, col3 = st.columns(3)
-with col1:
-    st.metric("Cohort size", f"{config.baseline.cohort_size:,}")
-    st.json(config.policies.dict())
-with col2:
-    st.metric("Budget per round", f"£{config.policies.round_budget_gbp:,.0f}")
-    st.json(config.transitions.dict())
-with col3:
-    st.metric("Scoring weights", config.scoring.weights)
-    st.json(config.costs.dict())
+col1.metric("Cohort size", f"{config.baseline.cohort_size:,}")
+col2.metric("Budget per round", f"£{config.policies.round_budget_gbp:,.0f}")
+col3.metric(
+    "Scoring weights",
+    " · ".join(f"{name} {weight:.2f}" for name, weight in config.scoring.weights.items()),
+)
+
+# Collapsed expanders still run their body, so the checkbox is what skips the
+# JSON rendering until someone asks for it.
+with st.expander("Default configuration JSON"):
+    if st.checkbox("Show JSON", key="show-default-config"):
+        dicts = default_config_dicts()
+        json_cols = st.columns(3)
+        for column, name in zip(json_cols, ("policies", "transitions", "costs")):
+            with column:
+                st.markdown(f"**{name.capitalize()}**")
+                st.json(dicts[name])
 
 st.caption(
     "All configurations are stored locally in /ageing_futures/config."
 )
 
-engine = get_engine()
-with DBSession(engine) as db:
-    sessions = crud.list_sessions(db)
+sessions = get_sessions()
 
 st.subheader("Recent sessions")
 if not sessions:
@@ -61,10 +79,10 @@ else:
     st.dataframe(
         [
             {
-                "Code": session.code,
-                "Created": session.created_at.strftime("%Y-%m-%d %H:%M"),
-                "Status": session.status,
-                "Current Round": session.current_round,
+                "Code": session["code"],
+                "Created": session["created_at"].strftime("%Y-%m-%d %H:%M"),
+                "Status": session["status"],
+                "Current Round": session["current_round"],
             }
             for session in sessions
         ]
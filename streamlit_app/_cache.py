@@ -0,0 +1,58 @@
+"""Process-wide cached resources shared by the Streamlit pages."""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import streamlit as st
+
+from ageing_futures.sim.utils import ConfigBundle, load_config_bundle
+
+
+@st.cache_resource(show_spinner=False)
+def get_config_bundle() -> ConfigBundle:
+    """Parsed default configuration, built once per server process.
+
+    The bundle is shared across sessions and reruns, so treat it as read-only and
+    derive per-session variants with ``.copy(update=...)``.
+    """
+    return load_config_bundle()
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def get_session_bundle(session_id: int, settings_json: str) -> ConfigBundle:
+    """Default bundle with a session's cohort size and scoring weights applied.
+
+    ``settings_json`` is the session's settings serialised with sorted keys, so
+    the bundle is rebuilt only when those settings change. Shared and read-only,
+    like :func:`get_config_bundle`.
+    """
+    settings = json.loads(settings_json)
+    base = get_config_bundle()
+    return ConfigBundle(
+        baseline=base.baseline.copy(
+            update={"cohort_size": settings.get("cohort_size", base.baseline.cohort_size)}
+        ),
+        transitions=base.transitions,
+        policies=base.policies,
+        costs=base.costs,
+        scoring=base.scoring.copy(
+            update={"weights": settings.get("scoring_weights", base.scoring.weights)}
+        ),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_simulation_pool() -> ProcessPoolExecutor:
+    """Worker processes for running teams' rounds side by side.
+
+    Workers are spawned rather than forked so they never inherit the server's
+    threads, and they stay warm (imports, JIT caches) between rounds.
+    """
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+
+
+__all__ = ["get_config_bundle", "get_session_bundle", "get_simulation_pool"]
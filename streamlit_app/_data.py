@@ -0,0 +1,167 @@
+"""Short-lived cached reads shared by the Streamlit pages.
+
+Every helper returns plain dicts/lists so ``st.cache_data`` can pickle the result
+cheaply, and viewers on the same session reuse one query per TTL window instead of
+one per rerun. Pages that write to the database call :func:`clear_read_caches`.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import streamlit as st
+
+from ageing_futures.db import crud
+from ageing_futures.db.connection import get_db_session
+from ageing_futures.db.models import Session as SessionModel
+
+READ_TTL_SECONDS = 5
+# Session rows change only on lecturer writes, which clear the cache explicitly.
+SESSION_TTL_SECONDS = 30
+
+
+@st.cache_data(ttl=SESSION_TTL_SECONDS, show_spinner=False)
+def get_session_info(session_id: int) -> Optional[Dict[str, Any]]:
+    """Session summary by primary key (pages keep the id from the Join page)."""
+    with get_db_session() as db:
+        session = db.get(SessionModel, session_id)
+        if session is None:
+            return None
+        return {
+            "id": session.id,
+            "code": session.code,
+            "status": session.status,
+            "current_round": session.current_round,
+        }
+
+
+@st.cache_data(ttl=READ_TTL_SECONDS, show_spinner=False)
+def get_sessions() -> List[Dict[str, Any]]:
+    with get_db_session() as db:
+        return [row._asdict() for row in crud.iter_sessions(db)]
+
+
+@st.cache_data(ttl=READ_TTL_SECONDS, show_spinner=False)
+def get_teams(session_id: int) -> List[Dict[str, Any]]:
+    with get_db_session() as db:
+        return [row._asdict() for row in crud.iter_teams(db, session_id)]
+
+
+@st.cache_data(ttl=READ_TTL_SECONDS, show_spinner=False)
+def get_leaderboard(session_id: int, current_round: int) -> List[Dict[str, Any]]:
+    """Latest scoring inputs per team; ``current_round`` keys the cache to the round."""
+    with get_db_session() as db:
+        return [row._asdict() for row in crud.fetch_leaderboard_metrics(db, session_id)]
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def get_result_detail(result_id: int) -> Dict[str, Any]:
+    """Parsed metrics and monthly trace for one result.
+
+    Results are written once and never updated, so the id alone keys the cache:
+    entries never go stale and survive :func:`clear_read_caches`.
+    """
+    with get_db_session() as db:
+        payload = crud.get_result_payload(db, result_id)
+    if payload is None:
+        return {"metrics": {}, "monthly": []}
+    return {"metrics": payload.metrics, "monthly": payload.monthly or []}
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def get_monthly_frame(result_id: int) -> pd.DataFrame:
+    """One result's monthly trace as a DataFrame, built once per result id."""
+    return pd.DataFrame(get_result_detail(result_id)["monthly"])
+
+
+@st.cache_data(ttl=READ_TTL_SECONDS, show_spinner=False)
+def get_team_results(session_id: int, team_id: int) -> List[Dict[str, Any]]:
+    """Per-round summaries and monthly traces for one team, oldest first.
+
+    Only result ids are queried here; each payload is parsed once and then served
+    from :func:`get_result_detail`. The persisted cohort state is left out;
+    dashboards never read it.
+    """
+    with get_db_session() as db:
+        rows = list(crud.iter_results_for_team(db, session_id, team_id))
+    return [
+        {"id": row.id, "round_id": row.round_id, **get_result_detail(row.id)}
+        for row in rows
+    ]
+
+
+@st.cache_data(ttl=2, show_spinner=False)
+def get_results_version(session_id: int) -> Optional[int]:
+    with get_db_session() as db:
+        return crud.latest_result_id(db, session_id)
+
+
+def watch_results(
+    session_id: int,
+    key: str,
+    min_interval: float = 2.0,
+    max_interval: float = 30.0,
+    backoff: float = 1.5,
+) -> None:
+    """Poll for new results and rerun the page only when the session's version changes.
+
+    The poll runs as a fragment, so idle ticks cost one cached scalar query instead
+    of a full page rerun with its queries and chart rebuilds. The fragment ticks
+    every ``min_interval`` seconds, but the query itself backs off by ``backoff``
+    after each unchanged check, up to ``max_interval``, and snaps back to
+    ``min_interval`` as soon as a new result lands.
+    """
+    state_key = f"_results_version_{key}"
+    interval_key = f"_results_interval_{key}"
+    due_key = f"_results_due_{key}"
+    st.session_state[state_key] = get_results_version(session_id)
+    st.session_state.setdefault(interval_key, min_interval)
+    st.session_state[due_key] = time.monotonic() + st.session_state[interval_key]
+
+    @st.fragment(run_every=min_interval)
+    def _poll() -> None:
+        now = time.monotonic()
+        if now < st.session_state[due_key]:
+            return
+        version = get_results_version(session_id)
+        if version != st.session_state.get(state_key):
+            st.session_state[state_key] = version
+            st.session_state[interval_key] = min_interval
+            for reader in (get_session_info, get_leaderboard, get_team_results):
+                reader.clear()
+            st.rerun()
+        interval = min(st.session_state[interval_key] * backoff, max_interval)
+        st.session_state[interval_key] = interval
+        st.session_state[due_key] = now + interval
+
+    _poll()
+
+
+def clear_read_caches() -> None:
+    """Drop cached reads after a write so the next rerun sees fresh data."""
+    for reader in (
+        get_session_info,
+        get_sessions,
+        get_teams,
+        get_leaderboard,
+        get_team_results,
+        get_results_version,
+    ):
+        reader.clear()
+
+
+__all__ = [
+    "READ_TTL_SECONDS",
+    "SESSION_TTL_SECONDS",
+    "get_session_info",
+    "get_sessions",
+    "get_teams",
+    "get_leaderboard",
+    "get_result_detail",
+    "get_monthly_frame",
+    "get_team_results",
+    "get_results_version",
+    "watch_results",
+    "clear_read_caches",
+]
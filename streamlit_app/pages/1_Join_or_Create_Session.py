@@ -5,17 +5,16 @@ import random
 from typing import Dict
 
 import streamlit as st
-from sqlmodel import Session as DBSession
 
 from ageing_futures.db import crud
-from ageing_futures.db.connection import get_engine
+from ageing_futures.db.connection import get_db_session
 from ageing_futures.sim.states import DEFAULT_ICON_CHOICES
-from ageing_futures.sim.utils import load_config_bundle
+from _cache import get_config_bundle
+from _data import clear_read_caches
 
 st.set_page_config(page_title="Join or Create Session", layout="wide")
 
-engine = get_engine()
-config = load_config_bundle()
+config = get_config_bundle()
 
 st.title("🧭 Join or Create a Session")
 st.write(
@@ -48,8 +47,9 @@ with col_create:
                 "budget_per_round": float(budget),
                 "scoring_weights": weights,
             }
-            with DBSession(engine) as db:
+            with get_db_session() as db:
                 session = crud.create_session(db, settings=settings, random_seed=int(seed))
+            clear_read_caches()
             st.success(f"Session created! Share the room code **{session.code}** with teams.")
 
 with col_join:
@@ -61,16 +61,18 @@ with col_join:
         icon = st.selectbox("Icon", DEFAULT_ICON_CHOICES)
         submitted = st.form_submit_button("Join session", use_container_width=True)
         if submitted:
-            with DBSession(engine) as db:
+            with get_db_session() as db:
                 session = crud.get_session_by_code(db, code)
                 if session is None:
                     st.error("Session not found. Check the code and try again.")
                 else:
                     team = crud.create_team(db, session, team_name, colour, icon)
+                    clear_read_caches()
                     st.success(
                         f"Welcome to {team.name}! Use the navigation to set policies and view the dashboard."
                     )
                     st.session_state["active_session_code"] = code
+                    st.session_state["active_session_id"] = session.id
                     st.session_state["active_team_id"] = team.id
                     st.session_state["active_team_name"] = team.name
 
@@ -2,52 +2,52 @@
 from __future__ import annotations
 
 import json
-from typing import Dict
+from typing import Dict, Tuple
 
 import streamlit as st
-from sqlmodel import Session as DBSession, select
 
 from ageing_futures.db import crud
-from ageing_futures.db.connection import get_engine
-from ageing_futures.db.models import Decision, Round
+from ageing_futures.db.connection import get_db_session
 from ageing_futures.sim.policies import calculate_policy_cost
-from ageing_futures.sim.utils import load_config_bundle
+from _cache import get_config_bundle
 
 st.set_page_config(page_title="Team Policies", layout="wide")
 
 st.title("🛠️ Policy Workshop")
 
-session_code = st.session_state.get("active_session_code")
+session_id = st.session_state.get("active_session_id")
 team_id = st.session_state.get("active_team_id")
-if not session_code or not team_id:
+if not session_id or not team_id:
     st.warning("Join a session first.")
     st.stop()
 
-engine = get_engine()
-config = load_config_bundle()
-
-with DBSession(engine) as db:
-    session = crud.get_session_by_code(db, session_code)
-    if session is None:
-        st.error("Session not found.")
-        st.stop()
-    current_round = db.exec(
-        select(Round).where(Round.session_id == session.id).order_by(Round.index.desc())
-    ).first()
-    if current_round is None:
-        st.info("The lecturer needs to start a round before policies can be submitted.")
-        st.stop()
-    existing_decision = db.exec(
-        select(Decision)
-        .where(Decision.session_id == session.id, Decision.team_id == team_id, Decision.round_id == current_round.id)
-        .limit(1)
-    ).first()
+config = get_config_bundle()
+
+with get_db_session() as db:
+    context = crud.fetch_team_round_context(db, session_id, team_id)
+if context is None:
+    st.error("Session not found.")
+    st.stop()
+session, current_round, existing_decision = context
+if current_round is None:
+    st.info("The lecturer needs to start a round before policies can be submitted.")
+    st.stop()
+
+
+@st.cache_data(show_spinner=False)
+def estimate_policy_cost(selection: Tuple[Tuple[str, float, float], ...], cohort_size: int) -> float:
+    """Round cost for ``(policy_id, intensity, coverage)`` picks, memoised per selection."""
+    decisions = {
+        policy_id: {"intensity": intensity, "coverage": coverage}
+        for policy_id, intensity, coverage in selection
+    }
+    return calculate_policy_cost(get_config_bundle().policies, decisions, cohort_size)
+
 
 st.caption(f"Round {current_round.index} • Budget £{session.settings_json.get('budget_per_round', config.policies.round_budget_gbp):,.0f}")
 
 with st.form("policy-form"):
     selected: Dict[str, Dict[str, float]] = {}
-    total_cost = 0.0
     for policy in config.policies.policies:
         st.markdown(f"### {policy.name}")
         st.caption(policy.description)
@@ -60,11 +60,10 @@ with st.form("policy-form"):
         if intensity > 0 and coverage > 0:
             selected[policy.id] = {"intensity": intensity, "coverage": coverage}
 
-total_cost = calculate_policy_cost(
-    config.policies,
-    selected,
-    session.settings_json.get("cohort_size", config.baseline.cohort_size),
-)
+    total_cost = estimate_policy_cost(
+        tuple(sorted((key, value["intensity"], value["coverage"]) for key, value in selected.items())),
+        session.settings_json.get("cohort_size", config.baseline.cohort_size),
+    )
     st.metric("Estimated round spend", f"£{total_cost:,.0f}")
     submit = st.form_submit_button("Save decision", use_container_width=True)
     ready = st.form_submit_button("Save & Ready", use_container_width=True)
@@ -73,7 +72,7 @@ if submit or ready:
     if total_cost > session.settings_json.get("budget_per_round", config.policies.round_budget_gbp):
         st.error("Decision exceeds the available budget. Adjust policy intensities or coverage.")
     else:
-        with DBSession(engine) as db:
+        with get_db_session() as db:
             crud.upsert_decision(
                 db,
                 session_id=session.id,
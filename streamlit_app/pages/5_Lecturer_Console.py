@@ -2,29 +2,38 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Tuple
 
 import numpy as np
 import streamlit as st
-from sqlmodel import Session as DBSession, select
+from sqlmodel import select
 
 from ageing_futures.db import crud
-from ageing_futures.db.connection import get_engine
-from ageing_futures.db.models import Decision, Result, Round, Session as SessionModel, Team
-from ageing_futures.sim.engine import create_baseline_cohort, simulate_round
+from ageing_futures.db.connection import get_db_session
+from ageing_futures.db.models import Result, Session as SessionModel, Team
+from ageing_futures.sim.baseline import baseline_cohort_params
+from ageing_futures.sim.engine import create_baseline_cohort, run_team_round, timesteps_frame
 from ageing_futures.sim.shocks import PREDEFINED_SHOCKS, get_shock
-from ageing_futures.sim.states import Cohort
-from ageing_futures.sim.utils import ConfigBundle, load_config_bundle
+from ageing_futures.sim.states import Cohort, decode_cohort_state, encode_cohort_state
+from _cache import get_session_bundle, get_simulation_pool
+from _data import clear_read_caches
 
 st.set_page_config(page_title="Lecturer Console", layout="wide")
 
 st.title("🎓 Lecturer Console")
 st.write("Manage sessions, rounds, shocks, and run the simulation engine.")
 
-engine = get_engine()
-base_bundle = load_config_bundle()
 
-with DBSession(engine) as db:
+def run_in_pool(jobs: List[Tuple[Team, tuple]]) -> List[Tuple[Team, tuple]]:
+    """Run ``run_team_round`` for each job in the shared worker pool."""
+    pool = get_simulation_pool()
+    futures = {pool.submit(run_team_round, *args): team for team, args in jobs}
+    return [(futures[future], future.result()) for future in as_completed(futures)]
+
+
+with get_db_session() as db:
     sessions = crud.list_sessions(db)
 
 if not sessions:
@@ -34,21 +43,15 @@ if not sessions:
 session_lookup = {f"{session.code} (round {session.current_round})": session for session in sessions}
 selected_label = st.selectbox("Select session", list(session_lookup.keys()))
 selected_session = session_lookup[selected_label]
-session_bundle = ConfigBundle(
-    baseline=base_bundle.baseline.copy(
-        update={"cohort_size": selected_session.settings_json.get("cohort_size", base_bundle.baseline.cohort_size)}
-    ),
-    transitions=base_bundle.transitions,
-    policies=base_bundle.policies,
-    costs=base_bundle.costs,
-    scoring=base_bundle.scoring.copy(
-        update={"weights": selected_session.settings_json.get("scoring_weights", base_bundle.scoring.weights)}
-    ),
+session_bundle = get_session_bundle(
+    selected_session.id, json.dumps(selected_session.settings_json, sort_keys=True)
 )
 
-with DBSession(engine) as db:
-    teams = crud.list_teams(db, selected_session.id)
-    rounds = db.exec(select(Round).where(Round.session_id == selected_session.id).order_by(Round.index)).all()
+with get_db_session() as db:
+    overview = crud.get_session_overview(db, selected_session.id)
+teams = overview.teams
+teams_by_id = {team.id: team for team in teams}
+rounds = overview.rounds
 
 st.subheader("Session overview")
 cols = st.columns(4)
@@ -70,8 +73,9 @@ with st.expander("Start a new round"):
             payload = {"name": shock_choice}
         submitted = st.form_submit_button("Create round", use_container_width=True)
         if submitted:
-            with DBSession(engine) as db:
+            with get_db_session() as db:
                 crud.start_round(db, selected_session, round_index, months, shock=payload)
+            clear_read_caches()
             st.success(f"Round {round_index} created.")
             st.experimental_rerun()
 
@@ -82,17 +86,12 @@ current_round = rounds[-1]
 st.subheader(f"Round {current_round.index} controls")
 st.caption(f"Months to advance: {current_round.months_advanced}. Shock: {current_round.shock_json or 'None'}")
 
-with DBSession(engine) as db:
-    decisions = db.exec(
-        select(Decision).where(
-            Decision.session_id == selected_session.id,
-            Decision.round_id == current_round.id,
-        )
-    ).all()
+decisions = current_round.decisions
+decisions_by_team = {decision.team_id: decision for decision in decisions}
 
 decision_table = [
     {
-        "Team": next((team.name for team in teams if team.id == decision.team_id), f"Team {decision.team_id}"),
+        "Team": teams_by_id[decision.team_id].name if decision.team_id in teams_by_id else f"Team {decision.team_id}",
         "Budget": decision.budget_spent,
         "Locked": bool(decision.locked_ts),
     }
@@ -108,10 +107,21 @@ else:
 run_sim = st.button("Advance round", use_container_width=True, type="primary")
 if run_sim:
     st.info("Running simulation... this may take a few seconds for large cohorts.")
-    with DBSession(engine) as db:
+    shocks: List = []
+    if current_round.shock_json:
+        shock_obj = get_shock(current_round.shock_json.get("name", ""))
+        if shock_obj:
+            shocks.append(shock_obj)
+
+    with get_db_session() as db:
         results_created = []
+        pending = []
+        audit_rows = []
+        # Load every team's starting cohort first, then run the teams in worker
+        # processes; only the database reads and writes stay on this thread.
+        jobs = []
         for team in teams:
-            decision = next((d for d in decisions if d.team_id == team.id), None)
+            decision = decisions_by_team.get(team.id)
             decisions_payload = decision.policies_json if decision else {}
 
             prev_result = db.exec(
@@ -121,60 +131,81 @@ if run_sim:
                 .limit(1)
             ).first()
 
-            if prev_result and "cohort_state" in prev_result.timeseries_json:
-                cohort_state = prev_result.timeseries_json["cohort_state"]
+            previous = prev_result.timeseries_json if prev_result else {}
+            if "cohort_state_npz" in previous:
+                cohort_state = decode_cohort_state(previous["cohort_state_npz"])
+                cohort_params = previous.get("cohort_params", {})
+            elif "cohort_state" in previous:
+                # Results recorded before the compressed format stored plain lists and
+                # no params; take the bed capacities from the session's baseline.
+                cohort_state = {key: np.array(value) for key, value in previous["cohort_state"].items()}
+                cohort_params = baseline_cohort_params(session_bundle.baseline)
+            else:
+                cohort_state = None
+
+            if cohort_state is not None:
                 cohort = Cohort(
-                    {key: np.array(value) for key, value in cohort_state.items()},
-                    months_elapsed=prev_result.timeseries_json.get("months_elapsed", 0),
+                    cohort_state,
+                    months_elapsed=previous.get("months_elapsed", 0),
+                    params=cohort_params,
+                    categories=previous.get("cohort_categories", {}),
                 )
             else:
                 baseline = session_bundle.baseline
                 cohort = create_baseline_cohort(selected_session.random_seed + team.id, baseline)
 
-            shocks: List = []
-            if current_round.shock_json:
-                shock_obj = get_shock(current_round.shock_json.get("name", ""))
-                if shock_obj:
-                    shocks.append(shock_obj)
-
-            cohort, timesteps, summary, _ = simulate_round(
-                cohort,
-                months=current_round.months_advanced,
-                decisions=decisions_payload,
-                shocks=shocks,
-                config_bundle=session_bundle,
-                seed=selected_session.random_seed + current_round.index + team.id,
+            jobs.append(
+                (
+                    team,
+                    (
+                        cohort,
+                        current_round.months_advanced,
+                        decisions_payload,
+                        shocks,
+                        session_bundle,
+                        selected_session.random_seed + current_round.index + team.id,
+                    ),
+                )
             )
 
-            monthly_payload = [
-                {
-                    "month": result.month_index,
-                    "incidence": result.incidence,
-                    "hospital_admissions": result.hospital_admissions,
-                    "bed_days": result.bed_days,
-                    "care_home_admissions": result.care_home_admissions,
-                    "deaths": result.deaths,
-                    "costs_gbp": result.costs_gbp,
-                    "qalys": result.qalys,
-                    "disability_prevalence": result.disability_prevalence,
-                    "equity_gap_disability": result.equity_gaps.get("disability", 0.0),
-                }
-                for result in timesteps
-            ]
-            state_payload = {key: value.tolist() for key, value in cohort.data.items()}
+        try:
+            outputs = run_in_pool(jobs)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory) and the cached pool cannot be
+            # reused; drop it and rerun the round once on a fresh pool.
+            get_simulation_pool.clear()
+            outputs = run_in_pool(jobs)
+
+        for team, (cohort, timesteps, summary) in outputs:
             timeseries_payload = {
-                "monthly": monthly_payload,
-                "cohort_state": state_payload,
+                "monthly": timesteps_frame(timesteps).to_dict("records"),
+                "cohort_state_npz": encode_cohort_state(cohort.data),
+                "cohort_params": cohort.params,
+                "cohort_categories": cohort.categories,
                 "months_elapsed": cohort.months_elapsed,
             }
-            crud.record_result(
-                db,
-                session_id=selected_session.id,
-                team_id=team.id,
-                round_id=current_round.id,
-                metrics=summary,
-                timeseries=timeseries_payload,
+            pending.append(
+                crud.build_result(
+                    session_id=selected_session.id,
+                    team_id=team.id,
+                    round_id=current_round.id,
+                    metrics=summary,
+                    timeseries=timeseries_payload,
+                )
+            )
+            audit_rows.append(
+                {
+                    "session_id": selected_session.id,
+                    "team_id": team.id,
+                    "action": "result_recorded",
+                    "payload_json": {"round": current_round.id},
+                }
             )
             results_created.append((team.name, summary))
-        crud.lock_round(db, current_round)
+        # Results, their audit rows and the round lock land in one transaction.
+        crud.record_results(db, pending, commit=False)
+        crud.log_audits(db, audit_rows, commit=False)
+        crud.lock_round(db, current_round, commit=False)
+        db.commit()
+    clear_read_caches()
     st.success(f"Simulated {len(results_created)} teams. Leaderboard updated.")
@@ -1,76 +1,154 @@
 """Data export utilities."""
 from __future__ import annotations
 
+import csv
 import io
-import json
+from typing import Any, Dict, Iterator, List, Tuple
+
 import pandas as pd
 import streamlit as st
-from sqlmodel import Session as DBSession, select
 
 from ageing_futures.db import crud
-from ageing_futures.db.connection import get_engine
-from ageing_futures.db.models import Result, Team
+from ageing_futures.db.connection import get_db_session
+from _data import get_results_version, get_session_info, get_teams
 
 st.set_page_config(page_title="Exports", layout="wide")
 
 st.title("📦 Exports")
 st.write("Download per-team results and session summaries.")
 
-session_code = st.session_state.get("active_session_code")
-if not session_code:
+session_id = st.session_state.get("active_session_id")
+if not session_id:
     st.warning("Join or create a session first.")
     st.stop()
 
-engine = get_engine()
-with DBSession(engine) as db:
-    session = crud.get_session_by_code(db, session_code)
-    if session is None:
-        st.error("Session not found.")
-        st.stop()
-    teams = crud.list_teams(db, session.id)
-    results = db.exec(
-        select(Result)
-        .where(Result.session_id == session.id)
-        .order_by(Result.team_id, Result.round_id)
-    ).all()
-
-if not results:
+session = get_session_info(session_id)
+if session is None:
+    st.error("Session not found.")
+    st.stop()
+
+results_version = get_results_version(session_id)
+if results_version is None:
     st.info("No results available yet. Run at least one round.")
     st.stop()
 
-summary_rows = []
-timeseries_rows = []
-for result in results:
-    team = next((team for team in teams if team.id == result.team_id), None)
-    team_name = team.name if team else f"Team {result.team_id}"
-    summary_row = {"team": team_name, "round": result.round_id}
-    summary_row.update(result.metrics_json)
-    summary_rows.append(summary_row)
-    for record in result.timeseries_json.get("monthly", []):
-        record_copy = dict(record)
-        record_copy.update({"team": team_name, "round": result.round_id})
-        timeseries_rows.append(record_copy)
-
-summary_df = pd.DataFrame(summary_rows)
-timeseries_df = pd.DataFrame(timeseries_rows)
-
-summary_buffer = io.StringIO()
-timeseries_buffer = io.StringIO()
-summary_df.to_csv(summary_buffer, index=False)
-timeseries_df.to_csv(timeseries_buffer, index=False)
+
+def team_names(session_id: int) -> Dict[int, str]:
+    return {team["id"]: team["name"] for team in get_teams(session_id)}
+
+
+def _to_parquet(frame: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    frame.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_parquet_exports(session_id: int, results_version: int) -> Tuple[bytes, bytes]:
+    """Summary and monthly tables as zstd-compressed Parquet, cached like the CSVs.
+
+    Each result's monthly trace becomes one small columnar frame and the frames
+    are concatenated once, so no per-row dicts are kept. pyarrow ships with
+    Streamlit, so it is always available here.
+    """
+    names = team_names(session_id)
+    summary_rows = []
+    monthly_frames = []
+    with get_db_session() as db:
+        for result in crud.iter_results_for_session(db, session_id):
+            team_name = names.get(result.team_id, f"Team {result.team_id}")
+            summary_rows.append({"team": team_name, "round": result.round_id, **result.metrics_json})
+            monthly = pd.DataFrame(result.timeseries_json.get("monthly", []))
+            monthly["team"] = team_name
+            monthly["round"] = result.round_id
+            monthly_frames.append(monthly)
+    timeseries_df = pd.concat(monthly_frames, ignore_index=True)
+    return _to_parquet(pd.DataFrame(summary_rows)), _to_parquet(timeseries_df)
+
+
+def _export_rows(
+    session_id: int, names: Dict[int, str]
+) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Yield each result's summary row and monthly rows, streamed from the database."""
+    with get_db_session() as db:
+        for result in crud.iter_results_for_session(db, session_id):
+            team_name = names.get(result.team_id, f"Team {result.team_id}")
+            summary_row = {"team": team_name, "round": result.round_id, **result.metrics_json}
+            monthly_rows = [
+                {**record, "team": team_name, "round": result.round_id}
+                for record in result.timeseries_json.get("monthly", [])
+            ]
+            yield summary_row, monthly_rows
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_csv_exports(session_id: int, results_version: int) -> Tuple[bytes, bytes]:
+    """Summary and monthly CSVs, written row by row while results stream from the database.
+
+    A first pass collects the union of keys across all rows (in first-seen
+    order) so a metric added in a later round still gets its own column; a
+    second pass writes each row straight into its ``DictWriter``. Only one
+    result's rows are held at a time.
+
+    ``results_version`` keys the cache to the session's latest result, so the
+    files are rebuilt only after a new round lands rather than on every rerun.
+    """
+    names = team_names(session_id)
+    summary_fields: Dict[str, None] = {}
+    timeseries_fields: Dict[str, None] = {}
+    for summary_row, monthly_rows in _export_rows(session_id, names):
+        summary_fields.update(dict.fromkeys(summary_row))
+        for row in monthly_rows:
+            timeseries_fields.update(dict.fromkeys(row))
+
+    summary_buffer = io.StringIO()
+    timeseries_buffer = io.StringIO()
+    if summary_fields:
+        summary_writer = csv.DictWriter(summary_buffer, fieldnames=list(summary_fields))
+        summary_writer.writeheader()
+        timeseries_writer = csv.DictWriter(timeseries_buffer, fieldnames=list(timeseries_fields))
+        if timeseries_fields:
+            timeseries_writer.writeheader()
+        for summary_row, monthly_rows in _export_rows(session_id, names):
+            summary_writer.writerow(summary_row)
+            timeseries_writer.writerows(monthly_rows)
+    return summary_buffer.getvalue().encode("utf-8"), timeseries_buffer.getvalue().encode("utf-8")
+
+
+summary_parquet, timeseries_parquet = build_parquet_exports(session_id, results_version)
 
 st.download_button(
     label="Download round summaries",
-    data=summary_buffer.getvalue().encode("utf-8"),
-    file_name=f"ageing_futures_{session.code}_summary.csv",
-    mime="text/csv",
+    data=summary_parquet,
+    file_name=f"ageing_futures_{session['code']}_summary.parquet",
+    mime="application/octet-stream",
 )
 
 st.download_button(
     label="Download monthly timeseries",
-    data=timeseries_buffer.getvalue().encode("utf-8"),
-    file_name=f"ageing_futures_{session.code}_timeseries.csv",
-    mime="text/csv",
+    data=timeseries_parquet,
+    file_name=f"ageing_futures_{session['code']}_timeseries.parquet",
+    mime="application/octet-stream",
 )
 
-st.caption("CSV exports include per-team decisions, outcomes, and monthly traces for further analysis.")
+with st.expander("CSV downloads"):
+    # The expander body runs on every rerun, so only build the CSVs once asked.
+    if st.checkbox("Prepare CSV files", key="prepare-csv-exports"):
+        summary_csv, timeseries_csv = build_csv_exports(session_id, results_version)
+        st.download_button(
+            label="Download round summaries (CSV)",
+            data=summary_csv,
+            file_name=f"ageing_futures_{session['code']}_summary.csv",
+            mime="text/csv",
+        )
+        st.download_button(
+            label="Download monthly timeseries (CSV)",
+            data=timeseries_csv,
+            file_name=f"ageing_futures_{session['code']}_timeseries.csv",
+            mime="text/csv",
+        )
+
+st.caption(
+    "Parquet exports load directly into pandas, R (arrow) or DuckDB; CSV is kept for spreadsheets. "
+    "Both include per-team decisions, outcomes, and monthly traces for further analysis."
+)
@@ -9,27 +9,51 @@ import streamlit as st
 from PIL import Image, ImageDraw, ImageFont
 
 from ageing_futures.sim.shocks import PREDEFINED_SHOCKS
-from ageing_futures.sim.utils import load_config_bundle
+from _cache import get_config_bundle
 
 st.set_page_config(page_title="Printables", layout="wide")
 
 st.title("🖨️ Printables")
 st.write("Download ready-to-print policy and shock cards with QR codes back to the app.")
 
-bundle = load_config_bundle()
-FONT = ImageFont.load_default()
+bundle = get_config_bundle()
+CARD_SIZE = (800, 480)
+HEADER_HEIGHT = 80
 
 
+@st.cache_resource(show_spinner=False)
+def card_font(size: int) -> ImageFont.ImageFont:
+    """DejaVu Sans at ``size`` px, falling back to Pillow's built-in font."""
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+@st.cache_resource(show_spinner=False)
+def card_base() -> Image.Image:
+    """Background and header bar shared by every card; copy before drawing on it."""
+    image = Image.new("RGB", CARD_SIZE, color=(240, 245, 255))
+    ImageDraw.Draw(image).rectangle([0, 0, CARD_SIZE[0], HEADER_HEIGHT], fill=(0, 79, 159))
+    return image
+
+
+@st.cache_resource(show_spinner=False)
+def qr_image(url: str) -> Image.Image:
+    """QR code for ``url`` at card size; shared read-only across reruns and sessions."""
+    return qrcode.make(url).resize((160, 160))
+
+
+@st.cache_data(show_spinner=False)
 def render_card(title: str, subtitle: str, body: str, url: str) -> bytes:
-    width, height = 800, 480
-    image = Image.new("RGB", (width, height), color=(240, 245, 255))
+    """PNG bytes for one card, rendered once per distinct content."""
+    width, height = CARD_SIZE
+    image = card_base().copy()
     draw = ImageDraw.Draw(image)
-    draw.rectangle([0, 0, width, 80], fill=(0, 79, 159))
-    draw.text((30, 20), title, fill="white", font=FONT)
-    draw.text((30, 100), subtitle, fill=(15, 23, 42), font=FONT)
-    draw.multiline_text((30, 140), body, fill=(15, 23, 42), font=FONT, spacing=4)
-    qr = qrcode.make(url).resize((160, 160))
-    image.paste(qr, (width - 180, height - 200))
+    draw.text((30, 20), title, fill="white", font=card_font(32))
+    draw.text((30, 100), subtitle, fill=(15, 23, 42), font=card_font(22))
+    draw.multiline_text((30, 140), body, fill=(15, 23, 42), font=card_font(18), spacing=6)
+    image.paste(qr_image(url), (width - 180, height - 200))
     buffer = io.BytesIO()
     image.save(buffer, format="PNG")
     return buffer.getvalue()
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from sqlmodel import Session as DBSession, SQLModel, select
+
+from ageing_futures.db import crud
+from ageing_futures.db.connection import _create_engine, _ensure_decision_unique_key
+from ageing_futures.db.models import Decision, Result, Round
+
+
+@pytest.fixture()
+def db():
+    engine = _create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with DBSession(engine) as session:
+        yield session
+
+
+def test_upsert_decision_updates_existing_row(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+
+    first = crud.upsert_decision(db, session.id, team.id, round_obj.id, {"a": {"intensity": 0.5}}, 10.0)
+    assert first.locked_ts is None
+    second = crud.upsert_decision(
+        db, session.id, team.id, round_obj.id, {"b": {"intensity": 1.0}}, 20.0, locked=True
+    )
+
+    rows = db.exec(select(Decision)).all()
+    assert len(rows) == 1
+    assert second.id == first.id
+    assert second.policies_json == {"b": {"intensity": 1.0}}
+    assert second.budget_spent == 20.0
+    assert second.locked_ts is not None
+
+
+def test_fetch_leaderboard_data_returns_latest_result_per_team(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    crud.create_team(db, session, "Beta", "#dc2626", "🏥")
+    first = crud.start_round(db, session, index=1, months=12)
+    second = crud.start_round(db, session, index=2, months=12)
+    crud.record_result(db, session.id, alpha.id, first.id, {"health_value": 1.0}, {})
+    crud.record_result(db, session.id, alpha.id, second.id, {"health_value": 2.0}, {})
+
+    rows = crud.fetch_leaderboard_data(db, session.id)
+    assert [team.name for team, _ in rows] == ["Alpha", "Beta"]
+    assert rows[0][1].metrics_json == {"health_value": 2.0}
+    assert rows[1][1] is None
+
+
+def test_latest_result_id_tracks_new_results(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+    assert crud.latest_result_id(db, session.id) is None
+    result = crud.record_result(db, session.id, team.id, round_obj.id, {}, {})
+    assert crud.latest_result_id(db, session.id) == result.id
+
+
+def test_iter_results_for_session_orders_by_team_then_round(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    beta = crud.create_team(db, session, "Beta", "#16a34a", "🏥")
+    first = crud.start_round(db, session, index=1, months=12)
+    second = crud.start_round(db, session, index=2, months=12)
+    crud.record_result(db, session.id, beta.id, first.id, {}, {})
+    crud.record_result(db, session.id, alpha.id, second.id, {}, {})
+    crud.record_result(db, session.id, alpha.id, first.id, {}, {})
+
+    rows = [(r.team_id, r.round_id) for r in crud.iter_results_for_session(db, session.id)]
+    assert rows == [(alpha.id, first.id), (alpha.id, second.id), (beta.id, first.id)]
+
+
+def test_get_session_overview_eager_loads_teams_rounds_and_decisions(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    crud.create_team(db, session, "Beta", "#16a34a", "🏥")
+    crud.start_round(db, session, index=1, months=12)
+    second = crud.start_round(db, session, index=2, months=12)
+    crud.upsert_decision(db, session.id, alpha.id, second.id, {}, 5.0)
+    session_id, alpha_id = session.id, alpha.id
+    db.expunge_all()
+
+    overview = crud.get_session_overview(db, session_id)
+    db.expunge_all()  # collections must already be loaded once detached
+    assert [team.name for team in overview.teams] == ["Alpha", "Beta"]
+    assert [round_obj.index for round_obj in overview.rounds] == [1, 2]
+    assert [d.team_id for d in overview.rounds[-1].decisions] == [alpha_id]
+
+
+def test_fetch_team_round_context_returns_latest_round_and_decision(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    beta = crud.create_team(db, session, "Beta", "#16a34a", "🏥")
+    assert crud.fetch_team_round_context(db, session.id, alpha.id)[1:] == (None, None)
+    crud.start_round(db, session, index=1, months=12)
+    second = crud.start_round(db, session, index=2, months=12)
+    crud.upsert_decision(db, session.id, alpha.id, second.id, {"a": {}}, 5.0)
+
+    found, round_obj, decision = crud.fetch_team_round_context(db, session.id, alpha.id)
+    assert found.id == session.id and round_obj.id == second.id
+    assert decision.policies_json == {"a": {}}
+    assert crud.fetch_team_round_context(db, session.id, beta.id)[2] is None
+    assert crud.fetch_team_round_context(db, -1, alpha.id) is None
+
+
+def test_fetch_leaderboard_metrics_extracts_latest_values_in_sql(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    crud.create_team(db, session, "Beta", "#dc2626", "🏥")
+    first = crud.start_round(db, session, index=1, months=12)
+    second = crud.start_round(db, session, index=2, months=12)
+    crud.record_result(db, session.id, alpha.id, first.id, {"health_value": 1.0}, {})
+    crud.record_result(
+        db, session.id, alpha.id, second.id, {"health_value": 2.5, "cost_value": 10.0}, {}
+    )
+
+    rows = [row._asdict() for row in crud.fetch_leaderboard_metrics(db, session.id)]
+    assert rows == [
+        {"team": "Alpha", "health_value": 2.5, "cost_value": 10.0, "capacity_value": 0.0, "equity_value": 0.0},
+        {"team": "Beta", "health_value": 0.0, "cost_value": 0.0, "capacity_value": 0.0, "equity_value": 0.0},
+    ]
+
+
+def test_record_results_inserts_built_results_in_one_batch(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    alpha = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    beta = crud.create_team(db, session, "Beta", "#dc2626", "🏥")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+
+    crud.record_results(
+        db,
+        [
+            crud.build_result(session.id, team.id, round_obj.id, {"health_value": value}, {"monthly": []})
+            for team, value in ((alpha, 1.0), (beta, 2.0))
+        ],
+    )
+
+    rows = crud.list_results_for_round(db, session.id, round_obj.id)
+    assert sorted(row.metrics_json["health_value"] for row in rows) == [1.0, 2.0]
+
+
+def test_get_result_payload_skips_cohort_state(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+    monthly = [{"month": 1, "incidence": 3}]
+    result = crud.record_result(
+        db, session.id, team.id, round_obj.id, {"health_value": 1.0},
+        {"monthly": monthly, "cohort_state_npz": "x" * 64},
+    )
+    bare = crud.record_result(db, session.id, team.id, round_obj.id, {}, {})
+
+    payload = crud.get_result_payload(db, result.id)
+    assert payload.metrics == {"health_value": 1.0}
+    assert payload.monthly == monthly
+    assert crud.get_result_payload(db, bare.id).monthly is None
+    ids = [row.id for row in crud.iter_results_for_team(db, session.id, team.id)]
+    assert ids == [result.id, bare.id]
+
+
+def test_decision_unique_key_is_added_to_legacy_tables(tmp_path):
+    engine = _create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        # Rebuild ``decision`` the way databases created before the upsert key looked.
+        connection.exec_driver_sql("DROP TABLE decision")
+        connection.exec_driver_sql(
+            "CREATE TABLE decision (id INTEGER PRIMARY KEY, session_id INTEGER, team_id INTEGER, "
+            "round_id INTEGER, policies_json JSON NOT NULL, budget_spent FLOAT, locked_ts DATETIME)"
+        )
+    _ensure_decision_unique_key(engine)
+    _ensure_decision_unique_key(engine)  # idempotent
+
+    with DBSession(engine) as db:
+        session = crud.create_session(db, settings={}, random_seed=1)
+        team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+        round_obj = crud.start_round(db, session, index=1, months=12)
+        crud.upsert_decision(db, session.id, team.id, round_obj.id, {}, 1.0)
+        crud.upsert_decision(db, session.id, team.id, round_obj.id, {}, 2.0)
+        assert [d.budget_spent for d in db.exec(select(Decision)).all()] == [2.0]
+
+
+def test_decision_unique_key_keeps_newest_legacy_duplicate(tmp_path):
+    engine = _create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE decision")
+        connection.exec_driver_sql(
+            "CREATE TABLE decision (id INTEGER PRIMARY KEY, session_id INTEGER, team_id INTEGER, "
+            "round_id INTEGER, policies_json JSON NOT NULL, budget_spent FLOAT, locked_ts DATETIME)"
+        )
+        # The old check-then-insert upsert could race and store the same key twice.
+        connection.exec_driver_sql(
+            "INSERT INTO decision (id, session_id, team_id, round_id, policies_json, budget_spent) "
+            "VALUES (1, 1, 1, 1, '{}', 1.0), (2, 1, 1, 1, '{}', 2.0), (3, 1, 2, 1, '{}', 3.0)"
+        )
+    _ensure_decision_unique_key(engine)
+
+    with DBSession(engine) as db:
+        rows = db.exec(select(Decision).order_by(Decision.id)).all()
+    assert [(row.id, row.budget_spent) for row in rows] == [(2, 2.0), (3, 3.0)]
+
+
+def test_upsert_decision_falls_back_for_dialects_without_on_conflict(db, monkeypatch):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+    monkeypatch.setattr(crud, "_UPSERT_INSERTS", {})
+
+    crud.upsert_decision(db, session.id, team.id, round_obj.id, {"a": {}}, 1.0)
+    second = crud.upsert_decision(db, session.id, team.id, round_obj.id, {"b": {}}, 2.0, locked=True)
+
+    rows = db.exec(select(Decision)).all()
+    assert len(rows) == 1
+    assert second.policies_json == {"b": {}} and second.locked_ts is not None
+
+
+def test_round_close_writes_commit_together(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+
+    crud.record_results(db, [crud.build_result(session.id, team.id, round_obj.id, {}, {})], commit=False)
+    crud.log_audits(db, [{"session_id": session.id, "action": "result_recorded"}], commit=False)
+    crud.lock_round(db, round_obj, commit=False)
+    db.rollback()
+
+    assert crud.list_results_for_round(db, session.id, round_obj.id) == []
+    assert db.get(Round, round_obj.id).lock_ts is None
+
+
+def test_non_finite_metrics_round_trip_through_results(db):
+    session = crud.create_session(db, settings={}, random_seed=1)
+    team = crud.create_team(db, session, "Alpha", "#2563eb", "🧓")
+    round_obj = crud.start_round(db, session, index=1, months=12)
+    crud.record_result(
+        db,
+        session.id,
+        team.id,
+        round_obj.id,
+        {"equity_gap": float("nan"), "cost_ratio": float("inf"), "qalys": 1.5, "note": None},
+        {"monthly": [{"month": 1, "equity_gap_disability": np.float64("nan")}]},
+    )
+    db.expunge_all()
+
+    result = db.exec(select(Result)).one()
+    assert math.isnan(result.metrics_json["equity_gap"])
+    assert result.metrics_json["cost_ratio"] == math.inf
+    assert result.metrics_json["qalys"] == 1.5 and result.metrics_json["note"] is None
+    assert math.isnan(result.timeseries_json["monthly"][0]["equity_gap_disability"])
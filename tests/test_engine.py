@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
+
 import numpy as np
+import pytest
 
+from ageing_futures.sim import engine
 from ageing_futures.sim.engine import create_baseline_cohort, simulate_round
 from ageing_futures.sim.shocks import get_shock
-from ageing_futures.sim.utils import load_config_bundle
+from ageing_futures.sim.states import decode_cohort_state, encode_cohort_state
+from ageing_futures.sim.utils import ConfigBundle, load_config_bundle
 
 
 def test_simulate_round_generates_outputs():
@@ -27,3 +32,131 @@ def test_simulate_round_generates_outputs():
     assert cohort.months_elapsed == 3
 
 
+def test_simulate_round_numpy_fallback(monkeypatch):
+    monkeypatch.setattr(engine, "HAVE_NUMBA", False)
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 500})
+    cohort = create_baseline_cohort(seed=123, baseline_config=baseline_cfg)
+    cohort, timesteps, summary, _ = simulate_round(
+        cohort, months=3, decisions=None, shocks=None, config_bundle=bundle, seed=456
+    )
+    assert len(timesteps) == 3
+    assert summary["deaths_total"] == 500 - cohort.data["alive"].sum()
+
+
+def test_numba_ltc_kernel_matches_numpy_path():
+    pytest.importorskip("numba")
+    from ageing_futures.sim.baseline import _assign_ltc_state, _assign_ltc_state_numpy
+
+    gen = np.random.default_rng(7)
+    ages = gen.integers(65, 96, size=5000).astype(np.float32)
+    imd = gen.integers(1, 6, size=5000).astype(np.int8)
+    u = gen.random(5000)
+    fast = _assign_ltc_state(ages, imd, u)
+    reference = _assign_ltc_state_numpy(ages, imd, u)
+    assert fast.dtype == np.int8
+    assert np.mean(fast != reference) < 1e-3
+
+
+def test_cohort_copy_keeps_packed_columns():
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 200})
+    cohort = create_baseline_cohort(seed=7, baseline_config=baseline_cfg)
+    clone = cohort.copy()
+    assert clone.data["alive"].base is clone.data["care_home"].base
+    assert clone.data["alive"].base is not cohort.data["alive"].base
+    clone.data["alive"][:] = 0
+    assert cohort.data["alive"].all()
+
+
+def test_numba_step_matches_numpy_step(monkeypatch):
+    pytest.importorskip("numba")
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 500})
+    cohort = create_baseline_cohort(seed=123, baseline_config=baseline_cfg)
+    decisions = {"falls_prevention": {"intensity": 0.8, "coverage": 0.6}}
+    _, _, fused, _ = simulate_round(cohort, 6, decisions, None, config_bundle=bundle, seed=456)
+    monkeypatch.setattr(engine, "HAVE_NUMBA", False)
+    _, _, fallback, _ = simulate_round(cohort, 6, decisions, None, config_bundle=bundle, seed=456)
+    assert fallback == pytest.approx(fused)
+
+
+def test_length_of_stay_sampler_tracks_gamma():
+    gen = np.random.default_rng(0)
+    sampled = engine._sample_length_of_stay(gen, 7.0, 200_000)
+    reference = np.maximum(1.0, gen.gamma(shape=3.5, scale=2.0, size=200_000))
+    assert sampled.min() >= 1.0
+    assert sampled.mean() == pytest.approx(reference.mean(), rel=0.02)
+    assert np.median(sampled) == pytest.approx(np.median(reference), rel=0.02)
+
+
+def test_simulate_rounds_batch_matches_sequential_runs():
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 300})
+    cohort = create_baseline_cohort(seed=11, baseline_config=baseline_cfg)
+    seeds = engine.spawn_seeds(99, 3)
+    batch = engine.simulate_rounds_batch(cohort, 3, None, None, seeds, config_bundle=bundle, n_jobs=2)
+    assert len(batch) == 3
+    for seed, (_, _, summary, _) in zip(seeds, batch):
+        _, _, expected, _ = simulate_round(cohort, 3, None, None, config_bundle=bundle, seed=seed)
+        assert summary == pytest.approx(expected)
+
+
+def test_cohort_state_round_trips_through_npz_payload():
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 200})
+    cohort = create_baseline_cohort(seed=5, baseline_config=baseline_cfg)
+    restored = decode_cohort_state(encode_cohort_state(cohort.data))
+    assert list(restored) == list(cohort.data)
+    for name, values in cohort.data.items():
+        assert restored[name].dtype == values.dtype
+        np.testing.assert_array_equal(restored[name], values)
+
+
+def test_timesteps_frame_matches_monthly_payload_fields():
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 300})
+    cohort = create_baseline_cohort(seed=3, baseline_config=baseline_cfg)
+    _, timesteps, _, _ = simulate_round(cohort, months=4, decisions={}, shocks=None, config_bundle=bundle, seed=9)
+    records = engine.timesteps_frame(timesteps).to_dict("records")
+    assert list(records[0]) == list(engine.MONTH_DTYPE.names)
+    for record, result in zip(records, timesteps):
+        assert record["month"] == result.month_index
+        assert record["bed_days"] == pytest.approx(result.bed_days)
+        assert record["equity_gap_disability"] == pytest.approx(result.equity_gaps["disability"])
+
+
+def test_run_team_round_matches_simulate_round():
+    bundle = load_config_bundle()
+    baseline_cfg = bundle.baseline.copy(update={"cohort_size": 300})
+    cohort = create_baseline_cohort(seed=5, baseline_config=baseline_cfg)
+    expected = simulate_round(cohort.copy(), 3, {}, None, bundle, 21)
+    result = engine.run_team_round(cohort.copy(), 3, {}, None, bundle, 21)
+    assert result[2] == expected[2]
+    assert len(result[1]) == len(expected[1])
+
+
+def test_config_bundle_hash_tracks_content():
+    bundle = load_config_bundle()
+    rebuilt = ConfigBundle(
+        baseline=bundle.baseline,
+        transitions=bundle.transitions,
+        policies=bundle.policies,
+        costs=bundle.costs,
+        scoring=bundle.scoring,
+    )
+    assert rebuilt.hash() == bundle.hash()
+
+    resized = dataclasses.replace(
+        bundle, baseline=bundle.baseline.copy(update={"cohort_size": bundle.baseline.cohort_size + 1})
+    )
+    assert resized.hash() != bundle.hash()
+
+
+def test_config_bundle_is_frozen_and_hashes_lazily():
+    bundle = load_config_bundle()
+    fresh = dataclasses.replace(bundle)
+    assert "_digest" not in vars(fresh)
+    assert fresh.hash() == bundle.hash()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        fresh.baseline = bundle.baseline
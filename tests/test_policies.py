@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from ageing_futures.sim.policies import aggregate_policy_effects, build_active_policies, calculate_policy_cost
+import pytest
+
+from ageing_futures.sim.policies import (
+    aggregate_policy_effects,
+    build_active_policies,
+    build_policy_schedule,
+    calculate_policy_cost,
+)
 from ageing_futures.sim.utils import load_config_bundle
 
 
@@ -15,3 +22,17 @@ def test_calculate_policy_cost_and_effects():
     active = build_active_policies(bundle.policies, decisions, {k: 5 for k in decisions})
     effects = aggregate_policy_effects(active.values())
     assert "ltc_onset" in effects or "disability_recovery" in effects
+
+
+def test_policy_schedule_matches_per_month_aggregation():
+    bundle = load_config_bundle()
+    decisions = {
+        "smoking_cessation": {"intensity": 1.0, "coverage": 0.5},
+        "community_rehab": {"intensity": 0.6, "coverage": 0.4},
+    }
+    started = {"smoking_cessation": 2}
+    schedule = build_policy_schedule(bundle.policies, decisions, started)
+    for month in range(12):
+        months_active = {key: started.get(key, 0) + month for key in decisions}
+        expected = aggregate_policy_effects(build_active_policies(bundle.policies, decisions, months_active).values())
+        assert schedule.modifiers(month) == pytest.approx(expected)